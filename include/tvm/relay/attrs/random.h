@@ -49,6 +49,18 @@ struct UniformAttrs : public tvm::AttrsNode<UniformAttrs> {
   }
 };
 
+struct NormalAttrs : public tvm::AttrsNode<NormalAttrs> {
+  Array<Integer> out_shape;
+  DataType out_dtype;
+
+  TVM_DECLARE_ATTRS(NormalAttrs, "relay.attrs.NormalAttrs") {
+    TVM_ATTR_FIELD(out_shape).describe("Shape of random numbers to generate");
+    TVM_ATTR_FIELD(out_dtype)
+        .set_default(NullValue<DataType>())
+        .describe("Data type of the generated numbers");
+  }
+};
+
 }  // namespace relay
 }  // namespace tvm
 #endif  // TVM_RELAY_ATTRS_RANDOM_H_
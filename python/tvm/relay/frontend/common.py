@@ -382,13 +382,15 @@ class AttrCvt(object):
         self._custom_check = custom_check
 
     def __call__(self, inputs, attrs, *args):
-        self._ignores.append("_output_shapes")
-        self._ignores.append("_input_shapes")
-        self._ignores.append("T")
-        self._ignores.append("use_cudnn_on_gpu")
-        self._ignores.append("_node_name")
-        self._ignores.append("is_training")
-        self._ignores.append("_target_layout")
+        # Extend a copy so converter instances can be reused across calls
+        ignores = list(self._ignores)
+        ignores.append("_output_shapes")
+        ignores.append("_input_shapes")
+        ignores.append("T")
+        ignores.append("use_cudnn_on_gpu")
+        ignores.append("_node_name")
+        ignores.append("is_training")
+        ignores.append("_target_layout")
 
         # apply custom check
         if self._custom_check:
@@ -403,7 +405,7 @@ class AttrCvt(object):
             op_name = self._op_name(attrs)
 
         # ignore 'tvm_custom' always
-        self._ignores.append("tvm_custom")
+        ignores.append("tvm_custom")
 
         # convert attributes
         new_attrs = {}
@@ -414,7 +416,7 @@ class AttrCvt(object):
                 )
             if k in self._disables:
                 logger.debug("Attribute %s is disabled in relay.sym.%s", k, op_name)
-            elif k in self._ignores:
+            elif k in ignores:
                 if k != "tvm_custom":
                     logger.debug("Attribute %s is ignored in relay.sym.%s", k, op_name)
             elif k in self._transforms:
@@ -17,8 +17,11 @@
 # pylint: disable=invalid-name, import-self, len-as-condition, unused-argument, too-many-lines
 # pylint: disable=import-outside-toplevel
 """ONNX: Open Neural Network Exchange frontend for Relay."""
-import copy
+import bisect
+import collections
+import functools
 import warnings
+import weakref
 from typing import Optional
 
 import numpy as np
@@ -66,6 +69,24 @@ ONNX_DEFAULT_CONFIGS = {
     "use_nt_batch_matmul": True,
 }
 
+# Lowest representable value of each dtype, used as the padding value of max pooling.
+_DTYPE_MIN = {
+    dtype: (np.finfo(dtype).min if dtype.startswith("float") else np.iinfo(dtype).min)
+    for dtype in (
+        "int8",
+        "int16",
+        "int32",
+        "int64",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
+        "float16",
+        "float32",
+        "float64",
+    )
+}
+
 
 class onnx_input(list):
     """A helper extension to list that returns None for out of bound indices."""
@@ -76,10 +97,11 @@ class onnx_input(list):
                 stop = len(self)
             else:
                 stop = item.stop
-            indices = list(range(stop)[item])
-            return [self[i] for i in indices]
+            num_inputs = len(self)
+            get = super().__getitem__
+            return [get(i) if i < num_inputs else None for i in range(stop)[item]]
         if isinstance(item, int):
-            return list(self)[item] if item < len(self) else None
+            return super().__getitem__(item) if item < len(self) else None
         raise TypeError("list indices must be integers or slices, not %s" % type(item).__name__)
 
 
@@ -92,38 +114,140 @@ def get_numpy(tensor_proto):
     return to_array(tensor_proto)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_onnx_type_table():
+    """Build the onnx integer datatype to numpy datatype string table once."""
+    try:
+        from onnx import TensorProto
+        from onnx.helper import tensor_dtype_to_np_dtype
+    except ImportError:
+        # Older onnx releases only provide the (now deprecated) mapping module.
+        try:
+            from onnx.mapping import TENSOR_TYPE_TO_NP_TYPE
+        except ImportError as e:
+            raise ImportError("Unable to import onnx which is required {}".format(e))
+        return {k: str(v) for k, v in TENSOR_TYPE_TO_NP_TYPE.items()}
+
+    return {t: str(tensor_dtype_to_np_dtype(t)) for t in TensorProto.DataType.values() if t}
+
+
 def get_type(elem_type):
     """Converts onnx integer datatype to numpy datatype"""
+    return _get_onnx_type_table()[elem_type]
+
+
+def _cached_infer_type(node):
+    """Memoized version of infer_type for the graph currently being imported.
+
+    Relay expressions are immutable, so the inferred type of an expression never
+    changes. Results are stored in a cache owned by the active GraphProto and
+    keyed weakly on the expression, so converters that query the same input
+    several times only run type inference on it once.
+    """
+    graph = GraphProto.current
+    if graph is None:
+        return infer_type(node)
+    cache = graph._infer_cache
     try:
-        from onnx.mapping import TENSOR_TYPE_TO_NP_TYPE
-    except ImportError as e:
-        raise ImportError("Unable to import onnx which is required {}".format(e))
+        return cache[node]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable, fall back to plain inference.
+        return infer_type(node)
+    typed_node = infer_type(node)
+    cache[node] = typed_node
+    return typed_node
+
+
+def _cached_infer_shape(node):
+    """Memoized version of infer_shape, see _cached_infer_type."""
+    checked_type = _cached_infer_type(node).checked_type
+    if hasattr(checked_type, "shape"):
+        return get_const_tuple(checked_type.shape)
+    return checked_type
+
+
+def _infer_dtype(node):
+    """Get the dtype of node, see _cached_infer_type.
 
-    return str(TENSOR_TYPE_TO_NP_TYPE[elem_type])
+    Constants and variables annotated with a tensor type carry their dtype, so it is
+    read directly without running type inference.
+    """
+    if isinstance(node, _expr.Constant):
+        return node.data.dtype
+    if isinstance(node, _expr.Var) and isinstance(node.type_annotation, _ty.TensorType):
+        return node.type_annotation.dtype
+    return _cached_infer_type(node).checked_type.dtype
+
+
+def _constant_scalar(const):
+    """Get the Python scalar held by a single element Constant.
+
+    Bounds and other scalar constants are often shared by many nodes, so the value is
+    memoized for the graph currently being imported, like _cached_infer_type.
+    """
+    graph = GraphProto.current
+    if graph is None:
+        return const.data.numpy().item()
+    cache = graph._scalar_cache
+    try:
+        return cache[const]
+    except KeyError:
+        pass
+    value = const.data.numpy().item()
+    cache[const] = value
+    return value
+
+
+def _get_weight_shape(weight, params):
+    """Get the shape of a weight, reading it from params if the weight is an initializer."""
+    if isinstance(weight, _expr.Var) and weight.name_hint in params:
+        return params[weight.name_hint].shape
+    return _cached_infer_shape(weight)
+
+
+def _reduce_pairwise(op, inputs):
+    """Combine inputs with the broadcasting binary op as a balanced tree.
+
+    This keeps the graph depth logarithmic in the number of inputs instead of linear.
+    """
+    inputs = list(inputs)
+    while len(inputs) > 1:
+        reduced = [op(lhs, rhs) for lhs, rhs in zip(inputs[0::2], inputs[1::2])]
+        if len(inputs) % 2:
+            reduced.append(inputs[-1])
+        inputs = reduced
+    return inputs[0]
+
+
+def _get_reduce_axis(data, attr):
+    """Return the reduction axes from attr, defaulting to every axis of data."""
+    if "axes" in attr:
+        return attr["axes"]
+    return list(range(len(_cached_infer_shape(data))))
 
 
 def get_info(info_proto):
     """Extract the shape from a ValueInfoProto."""
+    tensor_type = info_proto.type.tensor_type
     shape = []
     shape_name = []
-    for dim in info_proto.type.tensor_type.shape.dim:
-        name = dim.dim_param
+    for dim in tensor_type.shape.dim:
         value = dim.dim_value
-        if value is None or value == 0:
-            value = _ty.Any()
-            shape_name.append(name)
+        # Protobuf integers default to 0 when unset, which marks an unknown dimension.
+        if value == 0:
+            shape.append(_ty.Any())
+            shape_name.append(dim.dim_param)
         else:
+            shape.append(value)
             shape_name.append(value)
-        shape.append(value)
 
-    name = info_proto.name
-    if info_proto.type.tensor_type.elem_type:
-        dtype = get_type(info_proto.type.tensor_type.elem_type)
-    else:
-        dtype = None
-    return name, shape, dtype, shape_name
+    dtype = get_type(tensor_type.elem_type) if tensor_type.elem_type else None
+    return info_proto.name, shape, dtype, shape_name
 
 
+@functools.lru_cache(maxsize=None)
 def dimension_picker(prefix, suffix=""):
     """Check that dimensions are supported."""
 
@@ -194,6 +318,7 @@ def onnx_storage_order2layout(storage_order, dims, op_name):
     raise tvm.error.OpAttributeInvalid(msg.format(op_name))
 
 
+@functools.lru_cache(maxsize=None)
 def dimension_constraint():
     def _dim_check(attrs):
         if len(attrs["kernel_shape"]) in [1, 2, 3]:
@@ -207,7 +332,7 @@ def get_scalar(x, params, dtype="float32"):
     """Helper to get a scalar value for Quantized operators."""
     if isinstance(x, _expr.Var) and x.name_hint in params:
         return _op.const(params[x.name_hint].numpy(), dtype)
-    rank = len(infer_shape(x))
+    rank = len(_cached_infer_shape(x))
     assert rank <= 1, "scale and zero_point input must be scalars"
     if rank == 1:
         x = _op.squeeze(x, [0])
@@ -218,9 +343,13 @@ class OnnxOpConverter(object):
     """A helper class for holding onnx op converters."""
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_converter(cls, opset):
         """Get converter matches given opset.
 
+        The result is memoized per (class, opset) since every ONNX graph
+        requests the converter of every operator class.
+
         Parameters
         ----------
         opset: int
@@ -231,14 +360,21 @@ class OnnxOpConverter(object):
         converter, which should be `_impl_vx`. Number x is the biggest
             number smaller than or equal to opset belongs to all support versions.
         """
-        versions = [int(d.replace("_impl_v", "")) for d in dir(cls) if "_impl_v" in d]
-        versions = sorted(versions + [opset])
-        version = versions[max([i for i, v in enumerate(versions) if v == opset]) - 1]
-        if hasattr(cls, "_impl_v{}".format(version)):
-            return getattr(cls, "_impl_v{}".format(version))
-        raise NotImplementedError(
-            "opset version {} of {} not implemented".format(version, cls.__name__)
-        )
+        versions = cls._get_versions()
+        if not versions:
+            raise NotImplementedError(
+                "opset version {} of {} not implemented".format(opset, cls.__name__)
+            )
+        # An opset older than every implementation wraps around to the newest one.
+        version = versions[bisect.bisect_right(versions, opset) - 1]
+        return getattr(cls, "_impl_v{}".format(version))
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_versions(cls):
+        """Get the sorted opset versions the converter implements, including inherited ones."""
+        prefix = "_impl_v"
+        return tuple(sorted(int(d[len(prefix) :]) for d in dir(cls) if d.startswith(prefix)))
 
 
 class Unary(OnnxOpConverter):
@@ -264,11 +400,17 @@ class Elemwise(OnnxOpConverter):
     def _impl_v1(cls, inputs, attr, params):
         assert len(inputs) == 2, "Math op {} take 2 inputs, {} given".format(cls.name, len(inputs))
         op_name = cls.name
-        conv_ops = ["conv2d", "conv2d_transpose"]
-        if attr.get("broadcast", 0) and any(x in str(inputs[0]) for x in conv_ops):
-            # TODO(zhreshold): remove hard coded infershape
-            axis = int(attr.get("axis", 0))
-            inputs[1] = _op.expand_dims(inputs[1], axis=axis, num_newaxis=2)
+        if attr.get("broadcast", 0) and "axis" in attr:
+            # Legacy broadcasting aligns the second input with the first starting at axis,
+            # so pad its trailing dimensions for numpy style broadcasting.
+            rank_a = len(_cached_infer_shape(inputs[0]))
+            rank_b = len(_cached_infer_shape(inputs[1]))
+            axis = int(attr["axis"])
+            if axis < 0:
+                axis += rank_a
+            num_newaxis = rank_a - axis - rank_b
+            if num_newaxis > 0:
+                inputs[1] = _op.expand_dims(inputs[1], axis=rank_b, num_newaxis=num_newaxis)
         return get_relay_op(op_name)(*inputs)
 
 
@@ -287,32 +429,32 @@ class Pool(OnnxOpConverter):
         """Helper method to return the processed input data and AttrCvt object"""
 
         data = inputs[0]
-        input_shape = infer_shape(data)
-        input_dtype = infer_type(data).checked_type.dtype
+        input_shape = _cached_infer_shape(data)
+        input_dtype = _cached_infer_type(data).checked_type.dtype
         ndim = len(input_shape)
         if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
             if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
                 if cls.name == "avg_pool":
-                    pad_tuple = []
-                    for axis in range(len(input_shape) - 2):
-                        axis_shape = input_shape[2 + axis]
-                        stride = attr.get("strides", [1] * ndim)[axis]
-                        kernel = attr["kernel_shape"][axis]
-                        pad = get_pad_pair(axis_shape, kernel, stride, attr["auto_pad"])
-                        pad_tuple.append(pad)
-                    pad_tuple = tuple([val for pair in zip(*pad_tuple) for val in pair])
-                    attr["pads"] = pad_tuple
+                    # Same computation as get_pad_pair, done for all spatial axes at once.
+                    axis_shape = np.array(input_shape[2:], dtype="int64")
+                    strides = np.array(attr.get("strides", _ones(ndim - 2)), dtype="int64")
+                    kernel = np.array(attr["kernel_shape"], dtype="int64")
+                    mod = axis_shape % strides
+                    pad = np.maximum(kernel - np.where(mod == 0, strides, mod), 0)
+                    pad_before = pad // 2
+                    pad_after = pad - pad_before
+                    if "LOWER" in attr["auto_pad"]:
+                        pad_tuple = np.concatenate([pad_after, pad_before])
+                    else:
+                        pad_tuple = np.concatenate([pad_before, pad_after])
+                    attr["pads"] = tuple(pad_tuple.tolist())
                 else:
                     # Warning: Pool does not yet support dynamic shapes,
                     # one will need to run dynamic_to_static on this model after import
-                    if "int" in input_dtype:
-                        pad_val = np.iinfo(np.dtype(input_dtype)).min
-                    else:
-                        pad_val = np.finfo(np.dtype(input_dtype)).min
+                    pad_val = _DTYPE_MIN[input_dtype]
                     data = autopad(
                         data,
-                        attr.get("strides", [1] * (ndim - 2)),
+                        attr.get("strides", _ones(ndim - 2)),
                         attr["kernel_shape"],
                         [1] * ndim,
                         ndim,
@@ -382,7 +524,7 @@ class QLinearAveragePool(Pool):
 
         attr_cvt, data = cls._run_calculation(inputs, attr, params)
 
-        input_dtype = infer_type(data).checked_type.dtype
+        input_dtype = _cached_infer_type(data).checked_type.dtype
         # Onnxruntime doesn't actually do this op in integer, they dequantize to fp32
         # and then requantize afer (according to documentation below)
         # https://github.com/microsoft/onnxruntime/blob/master/docs/ContribOperators.md#com.microsoft.QLinearAveragePool
@@ -411,6 +553,26 @@ class InstanceNorm(OnnxOpConverter):
         return AttrCvt(op_name="instance_norm")(inputs, attr, params)
 
 
+@functools.lru_cache(maxsize=None)
+def _ones(n):
+    """Get a tuple of n ones, shared between calls so it can be used as a cheap default."""
+    return (1,) * n
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_const(value, dtype):
+    """Get a constant of dtype holding value, which must be a number or a (nested) tuple of numbers.
+
+    Constants are immutable, so nodes that need the same value share a single Constant.
+    """
+    return _op.const(np.asarray(value, dtype=dtype))
+
+
+def _int64_const(value):
+    """Get a shared int64 constant holding value, see _cached_const."""
+    return _cached_const(value, "int64")
+
+
 def autopad(
     data,
     strides,
@@ -425,21 +587,43 @@ def autopad(
     """
     Perform autopadding with dynamic input shapes
     """
+    dilated_kernel = [
+        (kernel - 1) * dilation + 1 for kernel, dilation in zip(kernel_shape, dilations)
+    ]
+    # If the spatial dimensions are known, compute the padding directly instead of
+    # emitting a graph that has to be constant folded afterwards.
+    data_shape = _cached_infer_shape(data)
+    if all(isinstance(dim, int) for dim in data_shape[2:ndim]):
+        pad = [[0, 0], [0, 0]]
+        for dim, stride, kernel, dilated in zip(
+            data_shape[2:ndim], strides, kernel_shape, dilated_kernel
+        ):
+            if dim % stride == 0:
+                total_pad = max(dilated - stride, 0)
+            else:
+                total_pad = max(dilated - dim % stride, 0)
+            if deconv:
+                total_pad = kernel - 1 - total_pad
+            pad_before = total_pad // 2
+            pad_after = total_pad - pad_before
+            if "LOWER" in mode:
+                pad.append([pad_after, pad_before])
+            else:
+                pad.append([pad_before, pad_after])
+        if isinstance(pad_value, (float, int)):
+            pad_value = _op.const(pad_value)
+        return _op.nn.pad(data, pad, pad_value, pad_type)
+
     # get attributes as constants
-    strides = _op.const(np.array(strides), dtype="int64")
-    dilated_kernel_shape = _op.const(
-        np.array(
-            [(kernel - 1) * dilation + 1 for kernel, dilation in zip(kernel_shape, dilations)]
-        ),
-        dtype="int64",
-    )
+    strides = _int64_const(tuple(strides))
+    dilated_kernel_shape = _int64_const(tuple(dilated_kernel))
     # get input shape
     shape = _op.strided_slice(shape_of(data, dtype="int64"), [2], [ndim])
 
     # set up integer constants
-    zero = _op.const(0, dtype="int64")
-    one = _op.const(1, dtype="int64")
-    two = _op.const(2, dtype="int64")
+    zero = _int64_const(0)
+    one = _int64_const(1)
+    two = _int64_const(2)
 
     # Calculate total padding
     mod = _op.mod(shape, strides)
@@ -449,7 +633,7 @@ def autopad(
 
     total_pad = _op.where(_op.equal(mod, zero), left, right)
     if deconv:
-        total_pad = _op.const(np.array(kernel_shape), dtype="int64") - one - total_pad
+        total_pad = _int64_const(tuple(kernel_shape)) - one - total_pad
 
     # split total padding into before and after
     pad_before = _op.floor_divide(total_pad, two)
@@ -466,7 +650,7 @@ def autopad(
         )
 
     # pad N and C with zeros
-    pad = _op.concatenate([_op.const(np.zeros([2, 2], dtype="int64"), dtype="int64"), pad], axis=0)
+    pad = _op.concatenate([_int64_const(((0, 0), (0, 0))), pad], axis=0)
 
     if isinstance(pad_value, (float, int)):
         pad_value = _op.const(pad_value)
@@ -482,25 +666,23 @@ class Conv(OnnxOpConverter):
         # Use shape of input to determine convolution type.
         data = inputs[0]
         kernel = inputs[1]
-        input_shape = infer_shape(data)
+        input_shape = _cached_infer_shape(data)
         ndim = len(input_shape)
 
-        kernel_type = infer_type(inputs[1])
-        kernel_shapes = [get_const_tuple(kernel_type.checked_type.shape)]
+        kernel_shape = _get_weight_shape(inputs[1], params)
 
         if "kernel_shape" not in attr:
-            attr["kernel_shape"] = kernel_shapes[0][2:]
+            attr["kernel_shape"] = kernel_shape[2:]
 
         if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
             if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
                 # Warning: Convolution does not yet support dynamic shapes,
                 # one will need to run dynamic_to_static on this model after import
                 data = autopad(
                     data,
-                    attr.get("strides", [1] * (ndim - 2)),
+                    attr.get("strides", _ones(ndim - 2)),
                     attr["kernel_shape"],
-                    attr.get("dilations", [1] * (ndim - 2)),
+                    attr.get("dilations", _ones(ndim - 2)),
                     ndim,
                     mode=attr["auto_pad"],
                 )
@@ -530,7 +712,7 @@ class Conv(OnnxOpConverter):
                 attr["dilations"] = [1] + list(attr["dilations"])
             if "pads" in attr:
                 attr["pads"] = [0, attr["pads"][0], 0, attr["pads"][1]]
-        attr["channels"] = kernel_shapes[0][0]
+        attr["channels"] = kernel_shape[0]
         out = AttrCvt(
             op_name=dimension_picker("conv"),
             transforms={
@@ -556,32 +738,45 @@ class ConvTranspose(OnnxOpConverter):
     """Operator converter for ConvTranspose."""
 
     @classmethod
-    def _impl_v1(cls, inputs, attr, params):
+    def _impl_common(cls, inputs, attr, params, static_same_pads=False):
         # get number of channels
-        out_type = infer_type(inputs[1])
-        out_shapes = [get_const_tuple(out_type.checked_type.shape)]
-        channels = out_shapes[0][1]
+        weight_shape = _get_weight_shape(inputs[1], params)
+        channels = weight_shape[1]
         attr["channels"] = channels
         groups = attr.get("group", 1)
 
         if "kernel_shape" not in attr:
-            attr["kernel_shape"] = out_shapes[0][2:]
+            attr["kernel_shape"] = weight_shape[2:]
 
         attr["groups"] = groups
         # infer pads for auto_pad
         data = inputs[0]
-        input_shape = infer_shape(data)
+        input_shape = _cached_infer_shape(data)
         ndim = len(input_shape)
         if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
-            if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
+            if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER") and static_same_pads:
+                # Since opset 11 the padding only depends on the attributes.
+                kernel_shape = np.array(attr["kernel_shape"], dtype="int64")
+                kndim = len(kernel_shape)
+                dilations = np.array(attr.get("dilations", _ones(kndim)), dtype="int64")
+                output_padding = np.array(attr.get("output_padding", [0] * kndim), dtype="int64")
+                strides = np.array(attr["strides"], dtype="int64")
+                total_pad = output_padding + (kernel_shape - 1) * dilations + 1 - strides
+                left = total_pad // 2
+                right = total_pad - left
+                if "LOWER" in attr["auto_pad"]:
+                    pad = np.concatenate([left, right])
+                else:
+                    pad = np.concatenate([right, left])
+                attr["pads"] = pad.tolist()
+            elif attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
                 # Warning: Convolution does not yet support dynamic shapes,
                 # one will need to run dynamic_to_static on this model after import
                 data = autopad(
                     data,
-                    attr.get("strides", [1] * (ndim - 2)),
+                    attr.get("strides", _ones(ndim - 2)),
                     attr["kernel_shape"],
-                    attr.get("dilations", [1] * (ndim - 2)),
+                    attr.get("dilations", _ones(ndim - 2)),
                     ndim,
                     deconv=True,
                     mode=attr["auto_pad"],
@@ -612,68 +807,12 @@ class ConvTranspose(OnnxOpConverter):
         return out
 
     @classmethod
-    def _impl_v11(cls, inputs, attr, params):
-        # get number of channels
-        out_type = infer_type(inputs[1])
-        out_shapes = [get_const_tuple(out_type.checked_type.shape)]
-        channels = out_shapes[0][1]
-        attr["channels"] = channels
-        groups = attr.get("group", 1)
-
-        if "kernel_shape" not in attr:
-            attr["kernel_shape"] = out_shapes[0][2:]
-
-        attr["groups"] = groups
-        # infer pads for auto_pad
-        data = inputs[0]
-        input_shape = infer_shape(data)
-        ndim = len(input_shape)
-        if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
-            if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
-                # Warning: Convolution does not yet support dynamic shapes,
-                # one will need to run dynamic_to_static on this model after import
-                kernel_shape = attr["kernel_shape"]
-                kndim = len(kernel_shape)
-                dilations = attr.get("dilations", [1] * kndim)
-                output_padding = attr.get("output_padding", [0] * kndim)
-                strides = attr["strides"]
-                total_pad = [0] * kndim
-                for i in range(kndim):
-                    total_pad[i] = (
-                        output_padding[i] + ((kernel_shape[i] - 1) * dilations[i] + 1) - strides[i]
-                    )
-                left = [p // 2 for p in total_pad]
-                right = [total_pad[i] - left[i] for i in range(kndim)]
-                if "LOWER" in attr["auto_pad"]:
-                    pad = left + right
-                else:
-                    pad = right + left
-                attr["pads"] = pad
-            elif attr["auto_pad"] == "VALID":
-                attr["pads"] = tuple([0 for i in range(ndim - 2)])
-            elif attr["auto_pad"] == "NOTSET":
-                pass
-            else:
-                msg = 'Value {} in attribute "auto_pad" of operator Conv is invalid.'
-                raise tvm.error.OpAttributeInvalid(msg.format(attr["auto_pad"]))
-            attr.pop("auto_pad")
+    def _impl_v1(cls, inputs, attr, params):
+        return cls._impl_common(inputs, attr, params)
 
-        out = AttrCvt(
-            op_name=dimension_picker("conv", "_transpose"),
-            transforms={
-                "kernel_shape": "kernel_size",
-                "dilations": ("dilation", 1),
-                "pads": ("padding", 0),
-                "group": ("groups", 1),
-            },
-            disables=["output_shape"],
-            custom_check=dimension_constraint(),
-        )([data, inputs[1]], attr, params)
-        use_bias = len(inputs) == 3
-        if use_bias:
-            out = _op.nn.bias_add(out, inputs[2])
-        return out
+    @classmethod
+    def _impl_v11(cls, inputs, attr, params):
+        return cls._impl_common(inputs, attr, params, static_same_pads=True)
 
 
 class GlobalAveragePool(OnnxOpConverter):
@@ -681,7 +820,7 @@ class GlobalAveragePool(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        rank = len(infer_shape(inputs[0]))
+        rank = len(_cached_infer_shape(inputs[0]))
         if rank == 3:
             return _op.nn.global_avg_pool1d(inputs[0])
         if rank == 4:
@@ -699,14 +838,14 @@ class QLinearGlobalAveragePool(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        rank = len(infer_shape(inputs[0]))
+        rank = len(_cached_infer_shape(inputs[0]))
 
         x_scale = get_scalar(inputs[1], params)
         x_zero_point = get_scalar(inputs[2], params, dtype="int32")
         y_scale = fold_constant(get_scalar(inputs[3], params))
         y_zero_point = get_scalar(inputs[4], params, dtype="int32")
 
-        input_dtype = infer_type(inputs[0]).checked_type.dtype
+        input_dtype = _cached_infer_type(inputs[0]).checked_type.dtype
 
         # Onnxruntime documentation does not mention that this global avg_pool should follow the
         # sequence dequantize -> float op -> quantize, but that is how QLinearAveragePool is done.
@@ -733,7 +872,7 @@ class GlobalMaxPool(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        rank = len(infer_shape(inputs[0]))
+        rank = len(_cached_infer_shape(inputs[0]))
         if rank == 3:
             return _op.nn.global_max_pool1d(inputs[0])
         if rank == 4:
@@ -771,108 +910,140 @@ class Gemm(OnnxOpConverter):
         assert len(inputs) == 3 or len(inputs) == 2, "Gemm op take 2 or 3 inputs, {} given".format(
             len(inputs)
         )
-        dtype = infer_type(inputs[0]).checked_type.dtype
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
         # Y = alpha * A * B + beta * C
         alpha = float(attr.get("alpha", 1.0))
         beta = float(attr.get("beta", 1.0))
         transA = int(attr.get("transA", 0))
         transB = int(attr.get("transB", 0))
         # get number of channels
-        channels = infer_channels(inputs[1], not transB)
+        weight_shape = _get_weight_shape(inputs[1], params)
+        channels = weight_shape[0] if transB else weight_shape[1]
         if transA:
             inputs[0] = _op.transpose(inputs[0], axes=(1, 0))
         if not transB:
             inputs[1] = _op.transpose(inputs[1], axes=(1, 0))
-        inputs[0] = _op.nn.batch_flatten(inputs[0])
+        if len(_cached_infer_shape(inputs[0])) != 2:
+            inputs[0] = _op.nn.batch_flatten(inputs[0])
         if alpha != 1.0:
             inputs[0] *= _expr.const(alpha, dtype=dtype)
         out = _op.nn.dense(inputs[0], inputs[1], units=channels)
         if len(inputs) == 3:
-            out = out + _expr.const(beta, dtype=dtype) * inputs[2]
+            if beta != 1.0:
+                out = out + _expr.const(beta, dtype=dtype) * inputs[2]
+            else:
+                out = out + inputs[2]
         return out
 
 
 class MatMul(OnnxOpConverter):
     """Operator converter for MatMul."""
 
+    @classmethod
+    def _batch_matmul(cls, a, b):
+        if ONNX_DEFAULT_CONFIGS["use_nt_batch_matmul"]:
+            # Transpose matrix dimensions of b.
+            b = _op.transpose(b, [0, 2, 1])
+            # Perform a NT batch matmul.
+            return _op.nn.batch_matmul(a, b)
+        # Perform a NN batch matmul.
+        return _op.nn.batch_matmul(a, b, transpose_b=False)
+
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         assert len(inputs) == 2, "MatMul op take 2 inputs, {} given".format(len(inputs))
-        # Need to check input shape as batch matmul must be supported.
+        # The rank of the inputs is always known statically, so the common 2D case can go
+        # straight to dense without building any shape computations.
+        a_static_shape = _cached_infer_shape(inputs[0])
+        b_static_shape = _cached_infer_shape(inputs[1])
+        a_rank = len(a_static_shape)
+        b_rank = len(b_static_shape)
+        if a_rank <= 2 and b_rank <= 2:
+            input_1_t = _op.transpose(inputs[1], axes=(1, 0))
+            return _op.nn.dense(inputs[0], input_1_t)
+        # 3D inputs need neither flattening nor reshaping back.
+        if a_rank == 3 and b_rank == 3:
+            return cls._batch_matmul(inputs[0], inputs[1])
+
+        # When performing a batch matmul, we need to properly handle N-dim shapes.
         a_shape = shape_of(inputs[0])
-        a_rank = infer_shape(a_shape)[0]
         b_shape = shape_of(inputs[1])
-        b_rank = infer_shape(b_shape)[0]
-        # When performing a batch matmul, we need to properly handle N-dim shapes.
-        if a_rank > 2 or b_rank > 2:
 
-            def flatten_to_nd(x, x_shape, nd=3):
-                ndims = infer_shape(x_shape)[0]
-                if ndims == nd:
-                    return x
-                newshape = _op.concatenate(
-                    [
-                        _expr.const([-1], dtype=infer_type(x_shape).checked_type.dtype),
-                        _op.strided_slice(x_shape, [ndims - nd + 1], [ndims]),
-                    ],
-                    0,
-                )
-                out = _op.reshape(x, fold_constant(newshape))
-                return out
-
-            b_type = infer_type(inputs[1])
-            # Convert to dense if the second matrix is 2d and non-dynamic
-            if b_rank == 2 and not _ty.is_dynamic(b_type.checked_type):
-                a = flatten_to_nd(inputs[0], a_shape, 2)
-                b = _op.transpose(inputs[1])
-                output = _op.nn.dense(a, b)
-            else:
-                # Convert a and b into 3 dimensional tensors.
-                a = flatten_to_nd(inputs[0], a_shape, 3)
-                b = flatten_to_nd(inputs[1], b_shape, 3)
-                if ONNX_DEFAULT_CONFIGS["use_nt_batch_matmul"]:
-                    # Transpose matrix dimensions of b.
-                    b = _op.transpose(b, [0, 2, 1])
-                    # Perform a NT batch matmul.
-                    output = _op.nn.batch_matmul(a, b)
-                else:
-                    # Perform a NN batch matmul.
-                    output = _op.nn.batch_matmul(a, b, transpose_b=False)
-            # Determine the output batch dimension.
+        def flatten_to_nd(x, x_shape, x_static_shape, nd=3):
+            ndims = len(x_static_shape)
+            if ndims == nd:
+                return x
+            # Fold the leading dimensions with a constant shape if the kept ones are static.
+            kept_shape = list(x_static_shape[ndims - nd + 1 :])
+            if all(isinstance(dim, int) for dim in kept_shape):
+                return _op.reshape(x, [-1] + kept_shape)
+            newshape = _op.concatenate(
+                [
+                    _expr.const([-1], dtype=_cached_infer_type(x_shape).checked_type.dtype),
+                    _op.strided_slice(x_shape, [ndims - nd + 1], [ndims]),
+                ],
+                0,
+            )
+            out = _op.reshape(x, fold_constant(newshape))
+            return out
+
+        b_type = _cached_infer_type(inputs[1])
+        # Convert to dense if the second matrix is 2d and non-dynamic
+        if b_rank == 2 and not _ty.is_dynamic(b_type.checked_type):
+            a = flatten_to_nd(inputs[0], a_shape, a_static_shape, 2)
+            b = _op.transpose(inputs[1])
+            output = _op.nn.dense(a, b)
+        else:
+            # Convert a and b into 3 dimensional tensors.
+            a = flatten_to_nd(inputs[0], a_shape, a_static_shape, 3)
+            b = flatten_to_nd(inputs[1], b_shape, b_static_shape, 3)
+            output = cls._batch_matmul(a, b)
+
+        # With fully static input shapes the output shape is known right away.
+        if (
+            a_rank >= 2
+            and b_rank >= 2
+            and all(isinstance(dim, int) for dim in a_static_shape + b_static_shape)
+        ):
             if a_rank > b_rank:
-                out_batch = _op.strided_slice(a_shape, [0], [a_rank - 2])
+                out_batch = list(a_static_shape[: a_rank - 2])
             elif a_rank < b_rank:
-                out_batch = _op.strided_slice(b_shape, [0], [b_rank - 2])
-            # If its unclear how broadcasting should be applied, the output
-            # shape is determined by choosing the maximum value from each input.
+                out_batch = list(b_static_shape[: b_rank - 2])
             else:
-                out_batch = _op.concatenate(
-                    [
-                        _op.maximum(
-                            _op.strided_slice(a_shape, [i], [i + 1]),
-                            _op.strided_slice(b_shape, [i], [i + 1]),
-                        )
-                        for i in range(a_rank - 2)
-                    ],
-                    0,
-                )
-            # Reshape output to original dimensions.
-            final_shape = _op.concatenate(
+                out_batch = [
+                    max(a_dim, b_dim)
+                    for a_dim, b_dim in zip(a_static_shape[:-2], b_static_shape[:-2])
+                ]
+            return _op.reshape(output, out_batch + [a_static_shape[-2], b_static_shape[-1]])
+
+        # Determine the output batch dimension.
+        if a_rank > b_rank:
+            out_batch = _op.strided_slice(a_shape, [0], [a_rank - 2])
+        elif a_rank < b_rank:
+            out_batch = _op.strided_slice(b_shape, [0], [b_rank - 2])
+        # If its unclear how broadcasting should be applied, the output
+        # shape is determined by choosing the maximum value from each input.
+        else:
+            out_batch = _op.concatenate(
                 [
-                    out_batch,
-                    _op.strided_slice(
-                        a_shape, [infer_shape(a_shape)[0] - 2], [infer_shape(a_shape)[0] - 1]
-                    ),
-                    _op.strided_slice(
-                        b_shape, [infer_shape(b_shape)[0] - 1], [infer_shape(b_shape)[0]]
-                    ),
+                    _op.maximum(
+                        _op.strided_slice(a_shape, [i], [i + 1]),
+                        _op.strided_slice(b_shape, [i], [i + 1]),
+                    )
+                    for i in range(a_rank - 2)
                 ],
                 0,
             )
-            return _op.reshape(output, fold_constant(final_shape))
-        # Otherwise a simple dense op will get the job done.
-        input_1_t = _op.transpose(inputs[1], axes=(1, 0))
-        return _op.nn.dense(inputs[0], input_1_t)
+        # Reshape output to original dimensions.
+        final_shape = _op.concatenate(
+            [
+                out_batch,
+                _op.strided_slice(a_shape, [a_rank - 2], [a_rank - 1]),
+                _op.strided_slice(b_shape, [b_rank - 1], [b_rank]),
+            ],
+            0,
+        )
+        return _op.reshape(output, fold_constant(final_shape))
 
 
 class Mod(OnnxOpConverter):
@@ -906,39 +1077,44 @@ class MaxUnpool(OnnxOpConverter):
     def _impl_v11(cls, inputs, attr, params):
         # Unpack inputs and attributes
         data = inputs[0]
-        data_type = infer_type(data).checked_type.dtype
+        data_type = _cached_infer_type(data).checked_type.dtype
         indices = inputs[1]
         output_shape = inputs[2]
         kernel_shape = attr.get("kernel_shape")
         pads = attr.get("pads", None)
-        strides = attr.get("strides", [1] * len(kernel_shape))
+        strides = attr.get("strides", _ones(len(kernel_shape)))
 
-        # Compute the proper output shape before padding.
-        multiplier = _op.concatenate(
-            [_expr.const([1, 1], dtype="int64"), _expr.const(list(strides), dtype="int64")], axis=0
-        )
-        total_output_shape = multiplier * shape_of(data, dtype="int64")
-        # Add extra dimensions from kernel size and stride mismatch
-        total_output_shape += _op.concatenate(
-            [_expr.const([0, 0], "int64"), _expr.const(list(kernel_shape), "int64")], axis=0
-        ) - _op.concatenate(
-            [_expr.const([0, 0], "int64"), _expr.const(list(strides), "int64")], axis=0
-        )
-
-        # Compute padding amount if output shape is specified.
+        data_shape = _cached_infer_shape(data)
         if output_shape is not None:
             total_output_shape = output_shape
-
-        elif pads is not None:
-            # Get pads in the proper format for relay.
-            pads = _op.concatenate(
-                [_expr.const([0, 0, 0, 0], "int64"), _expr.const(list(pads), "int64")], axis=0
+        elif all(isinstance(dim, int) for dim in data_shape):
+            # With a static input shape the output shape is computed right here.
+            total_output_shape = np.array(data_shape, dtype="int64")
+            total_output_shape[2:] *= strides
+            # Add extra dimensions from kernel size and stride mismatch
+            total_output_shape[2:] += np.subtract(kernel_shape, strides)
+            if pads is not None:
+                # Reversing maxpool means that padding actually makes our output smaller.
+                pads = np.concatenate([np.zeros(4, dtype="int64"), pads])
+                total_output_shape -= pads.reshape(-1, 2).sum(axis=-1)
+            total_output_shape = total_output_shape.tolist()
+        else:
+            # Compute the proper output shape before padding.
+            multiplier = _int64_const((1, 1) + tuple(strides))
+            total_output_shape = multiplier * shape_of(data, dtype="int64")
+            # Add extra dimensions from kernel size and stride mismatch
+            total_output_shape += _int64_const((0, 0) + tuple(kernel_shape)) - _int64_const(
+                (0, 0) + tuple(strides)
             )
-            pads = _op.reshape(pads, [-1, 2])
-            # Compute the total padding per axis.
-            total_pad = _op.sum(pads, axis=-1)
-            # Reversing maxpool means that padding actually makes our output smaller.
-            total_output_shape = total_output_shape - total_pad
+
+            # Compute padding amount if output shape is not specified.
+            if pads is not None:
+                # Get pads in the proper format for relay.
+                pads = _op.reshape(_int64_const((0, 0, 0, 0) + tuple(pads)), [-1, 2])
+                # Compute the total padding per axis.
+                total_pad = _op.sum(pads, axis=-1)
+                # Reversing maxpool means that padding actually makes our output smaller.
+                total_output_shape = total_output_shape - total_pad
 
         # Create a tensor of zeros then scatter our data through it.
         zeros_tensor = _op.zeros(total_output_shape, data_type)
@@ -960,12 +1136,11 @@ class LpPool(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        dtype = infer_type(inputs[0]).checked_type.dtype
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
         data = inputs[0]
-        input_shape = infer_shape(data)
+        input_shape = _cached_infer_shape(data)
         ndim = len(input_shape)
         if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
             if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
                 # Warning: LpPool does not yet support dynamic shapes,
                 # one will need to run dynamic_to_static on this model after import
@@ -1016,7 +1191,7 @@ class GlobalLpPool(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         # TODO: GlobalLpPool does not yet support dynamic shapes
-        in_shape = infer_shape(inputs[0])
+        in_shape = _cached_infer_shape(inputs[0])
         attr["kernel_shape"] = in_shape[2:]
 
         return LpPool._impl_v1(inputs, attr, params)
@@ -1032,21 +1207,25 @@ class Pad(OnnxOpConverter):
     """Operator converter for Pad."""
 
     @classmethod
-    def _impl_v1(cls, inputs, attr, params):
-        pad_width = []
-        pads = attr.pop("paddings")
-        dims = int(len(pads) / 2)
-        for i in range(dims):
-            pad_width.append((pads[i], pads[i + dims]))
-        attr["pad_width"] = pad_width
-        pad_mode = attr.get("mode", b"constant").decode("utf-8")
-        if pad_mode in ["constant", "edge", "reflect"]:
-            attr["pad_mode"] = pad_mode
-            attr.pop("mode", None)
-        else:
+    def _get_pad_width(cls, pads):
+        # ONNX lists all the begin pads first, then all the end pads.
+        dims = len(pads) // 2
+        return list(zip(pads[:dims], pads[dims:]))
+
+    @classmethod
+    def _get_pad_mode(cls, attr):
+        pad_mode = attr.get("mode", "constant")
+        if pad_mode not in ("constant", "edge", "reflect"):
             raise tvm.error.OpAttributeInvalid(
                 "Value " + pad_mode + ' in attribute "mode" is invalid for operator Pad.'
             )
+        return pad_mode
+
+    @classmethod
+    def _impl_v1(cls, inputs, attr, params):
+        attr["pad_width"] = cls._get_pad_width(attr.pop("paddings"))
+        attr["pad_mode"] = cls._get_pad_mode(attr)
+        attr.pop("mode", None)
 
         return AttrCvt(
             _op.nn.pad,
@@ -1057,20 +1236,9 @@ class Pad(OnnxOpConverter):
 
     @classmethod
     def _impl_v2(cls, inputs, attr, params):
-        pad_width = []
-        pads = attr.pop("pads")
-        dims = int(len(pads) / 2)
-        for i in range(dims):
-            pad_width.append((pads[i], pads[i + dims]))
-        attr["pad_width"] = pad_width
-        pad_mode = attr.get("mode", b"constant").decode("utf-8")
-        if pad_mode in ["constant", "edge", "reflect"]:
-            attr["pad_mode"] = pad_mode
-            attr.pop("mode", None)
-        else:
-            raise tvm.error.OpAttributeInvalid(
-                "Value " + pad_mode + ' in attribute "mode" is invalid for operator Pad.'
-            )
+        attr["pad_width"] = cls._get_pad_width(attr.pop("pads"))
+        attr["pad_mode"] = cls._get_pad_mode(attr)
+        attr.pop("mode", None)
 
         return AttrCvt(
             "pad",
@@ -1088,11 +1256,7 @@ class Pad(OnnxOpConverter):
             value = 0.0
 
         pad_width_expr = fold_constant(_op.transpose(_op.reshape(pads, (2, -1))))
-        pad_mode = attr.get("mode", b"constant").decode("utf-8")
-        if not pad_mode in ["constant", "edge", "reflect"]:
-            raise tvm.error.OpAttributeInvalid(
-                "Value " + pad_mode + ' in attribute "mode" is invalid for operator Pad.'
-            )
+        pad_mode = cls._get_pad_mode(attr)
 
         return _op.nn.pad(inputs[0], pad_width_expr, value, pad_mode=pad_mode)
 
@@ -1102,9 +1266,9 @@ class ParametricSoftPlus(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        alpha = _expr.const(float(attr.get("alpha", 1.0)))
-        beta = _expr.const(float(attr.get("beta", 1.0)))
-        return _op.log(_op.exp(beta * inputs[0]) + _expr.const(1.0)) * alpha
+        alpha = _cached_const(float(attr.get("alpha", 1.0)), "float32")
+        beta = _cached_const(float(attr.get("beta", 1.0)), "float32")
+        return _op.log(_op.exp(beta * inputs[0]) + _cached_const(1.0, "float32")) * alpha
 
 
 class Pow(OnnxOpConverter):
@@ -1115,9 +1279,17 @@ class Pow(OnnxOpConverter):
         x = inputs[0]
         y = inputs[1]
 
-        x_type = infer_type(x).checked_type.dtype
+        x_type = _cached_infer_type(x).checked_type.dtype
         output_type = x_type
-        y_type = infer_type(y).checked_type.dtype
+        y_type = _cached_infer_type(y).checked_type.dtype
+
+        # Small integral constant exponents are cheaper as a chain of multiplies.
+        if isinstance(y, _expr.Constant):
+            y_np = y.data.numpy()
+            if y_np.size == 1 and y_np.ndim <= len(_cached_infer_shape(x)):
+                exponent = y_np.item()
+                if exponent in (2, 3, 4, 5):
+                    return functools.reduce(_op.multiply, [x] * int(exponent))
 
         if not x_type.startswith("float"):
             x_type = "float32"
@@ -1139,6 +1311,21 @@ class Prelu(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         assert len(inputs) == 2, "Prelu need 2 inputs, {} given".format(len(inputs))
+        # A per channel slope maps directly onto nn.prelu along the channel axis.
+        data_static_shape = _cached_infer_shape(inputs[0])
+        alpha_shape = _cached_infer_shape(inputs[1])
+        ndim = len(data_static_shape)
+        if ndim >= 2 and len(alpha_shape) <= ndim:
+            alpha_shape = (1,) * (ndim - len(alpha_shape)) + tuple(alpha_shape)
+            channels = alpha_shape[1]
+            if (
+                all(isinstance(dim, int) for dim in alpha_shape)
+                and isinstance(data_static_shape[1], int)
+                and channels == data_static_shape[1]
+                and all(dim == 1 for i, dim in enumerate(alpha_shape) if i != 1)
+            ):
+                alpha = _op.reshape(inputs[1], [channels])
+                return _op.nn.prelu(inputs[0], alpha, axis=1)
         input_shape = shape_of(inputs[0])
         alpha = _op.broadcast_to_like(inputs[1], inputs[0])
         alpha = _op.reshape(alpha, [-1])
@@ -1151,7 +1338,7 @@ class Reciprocal(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        dtype = infer_type(inputs[0]).checked_type.dtype
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
         return _expr.const(1.0, dtype=dtype) / inputs[0]
 
 
@@ -1161,14 +1348,19 @@ class Flatten(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         axis = attr.get("axis", 1)
-        ishape = _op.shape_of(inputs[0])
-        ndim = infer_shape(ishape)[0]
+        data_shape = _cached_infer_shape(inputs[0])
+        ndim = len(data_shape)
         if axis < 0:
             axis = axis + ndim
 
         if axis == 1:
             out = _op.nn.batch_flatten(inputs[0])
+        elif all(isinstance(dim, int) for dim in data_shape):
+            pre_shape = int(np.prod(data_shape[:axis]))
+            post_shape = int(np.prod(data_shape[axis:]))
+            out = _op.reshape(inputs[0], [pre_shape, post_shape])
         else:
+            ishape = _op.shape_of(inputs[0])
             pre_shape = _op.prod(_op.strided_slice(ishape, [0], [axis], [1]), keepdims=True)
             post_shape = _op.prod(_op.strided_slice(ishape, [axis], [ndim], [1]), keepdims=True)
             newshape = _op.concatenate([pre_shape, post_shape], axis=0)
@@ -1199,7 +1391,7 @@ class DepthToSpace(OnnxOpConverter):
     @classmethod
     def _impl_v11(cls, inputs, attr, params):
         block_size = int(attr["blocksize"])
-        mode = attr.get("mode", b"DCR").decode("utf-8")
+        mode = attr.get("mode", "DCR")
         return _op.nn.depth_to_space(inputs[0], block_size, mode=mode)
 
 
@@ -1237,8 +1429,9 @@ class Selu(OnnxOpConverter):
     def _impl_v1(cls, inputs, attr, params):
         alpha = float(attr.get("alpha", 1.67326319217681884765625))
         gamma = float(attr.get("gamma", 1.05070102214813232421875))
-        return _expr.const(gamma) * (
-            _expr.const(-alpha) * _op.nn.relu(_expr.const(1.0) - _op.exp(inputs[0]))
+        return _cached_const(gamma, "float32") * (
+            _cached_const(-alpha, "float32")
+            * _op.nn.relu(_cached_const(1.0, "float32") - _op.exp(inputs[0]))
             + _op.nn.relu(inputs[0])
         )
 
@@ -1259,11 +1452,16 @@ class Shrink(OnnxOpConverter):
     @classmethod
     def _impl_v9(cls, inputs, attr, params):
         x = inputs[0]
-        dtype = infer_type(x).checked_type.dtype
-        lambd = _op.const(attr.get("lambd", 0.5), dtype=dtype)
+        dtype = _cached_infer_type(x).checked_type.dtype
+        lambd_value = attr.get("lambd", 0.5)
+        lambd = _op.const(lambd_value, dtype=dtype)
         bias = _op.const(attr.get("bias", 0.0), dtype=dtype)
 
         zeros = _op.zeros_like(x)
+        if lambd_value >= 0:
+            # At most one side applies, so a single select of x - sign(x) * bias is enough.
+            # Selecting rather than multiplying by a mask keeps NaN inputs mapped to zero.
+            return _op.where(_op.abs(x) > lambd, x - _op.sign(x) * bias, zeros)
         return _op.where(x < -lambd, x + bias, zeros) + _op.where(x > lambd, x - bias, zeros)
 
 
@@ -1272,7 +1470,9 @@ class Softsign(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        return inputs[0] / (_expr.const(1.0) + Absolute.get_converter(1)(inputs, attr, params))
+        return inputs[0] / (
+            _cached_const(1.0, "float32") + Absolute.get_converter(1)(inputs, attr, params)
+        )
 
 
 class Sub(Elemwise):
@@ -1287,10 +1487,7 @@ class Sum(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         # Onnx Sum Operator
-        for in_index in range(len(inputs) - 1):
-            inputs[in_index + 1] = _op.add(inputs[in_index], inputs[in_index + 1])
-
-        return inputs[len(inputs) - 1]
+        return _reduce_pairwise(_op.add, inputs)
 
 
 class Affine(OnnxOpConverter):
@@ -1298,8 +1495,8 @@ class Affine(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        alpha = _expr.const(attr.get("alpha", 1.0))
-        beta = _expr.const(attr.get("beta", 0.0))
+        alpha = _cached_const(attr.get("alpha", 1.0), "float32")
+        beta = _cached_const(attr.get("beta", 0.0), "float32")
         return (alpha * inputs[0]) + beta
 
 
@@ -1309,8 +1506,8 @@ class ThresholdedRelu(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         alpha = float(attr.get("alpha", 1.0))
-        alpha_tensor = _op.full_like(inputs[0], fill_value=_expr.const(alpha))
-        mask = _op.greater(inputs[0], alpha_tensor).astype("float32")
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
+        mask = _op.greater(inputs[0], _expr.const(alpha, dtype)).astype(dtype)
         return inputs[0] * mask
 
 
@@ -1340,7 +1537,7 @@ class Upsample(OnnxOpConverter):
     def _impl_v9(cls, inputs, attr, params):
         scales = attr.get("scales")
 
-        input_shape = infer_shape(inputs[0])
+        input_shape = _cached_infer_shape(inputs[0])
         dims = len(input_shape)
 
         if not scales:
@@ -1348,18 +1545,19 @@ class Upsample(OnnxOpConverter):
             assert len(inputs) == 2, "Upsample op takes 2 inputs, {} given".format(len(inputs))
 
             if get_name(inputs[1]) in params:
-                scales = params[inputs[1].name_hint].numpy()
+                scales = list(params[inputs[1].name_hint].numpy())
             else:
-                scales = inputs[1]
+                # Scales computed from constants fold to a Constant and take the static path.
+                scales = fold_constant(inputs[1])
         if isinstance(scales, _expr.Constant):
             scales = list(scales.data.numpy())
         if not isinstance(scales, _expr.Expr):
             assert scales[0] == 1.0 and scales[1] == 1.0
 
         mode = attr.get("mode")
-        if mode == b"nearest":
+        if mode == "nearest":
             method = "nearest_neighbor"
-        elif mode == b"linear":
+        elif mode == "linear":
             method = "trilinear" if dims == 5 else "bilinear"
         else:
             raise tvm.error.OpAttributeInvalid(
@@ -1411,7 +1609,7 @@ class Upsample(OnnxOpConverter):
 
 
 def shape_of(x, dtype="int64"):
-    ttype = infer_type(x).checked_type
+    ttype = _cached_infer_type(x).checked_type
     if not _ty.is_dynamic(ttype):
         shape = list(ttype.shape)
         return _expr.const(shape, dtype)
@@ -1434,7 +1632,10 @@ class CumSum(OnnxOpConverter):
         data = inputs[0]
         dim = inputs[1]
 
-        if dim is not None:
+        # The axis is almost always a constant, which needs no evaluation.
+        if isinstance(dim, _expr.Constant):
+            dim = int(dim.data.numpy())
+        elif dim is not None:
             dim = int(infer_value(dim, params).numpy())
 
         exclusive = attr.get("exclusive", 0)
@@ -1457,12 +1658,7 @@ class Cast(OnnxOpConverter):
 
     @classmethod
     def _impl_v5(cls, inputs, attr, params):
-        try:
-            from onnx.mapping import TENSOR_TYPE_TO_NP_TYPE
-
-            attr["to"] = str(TENSOR_TYPE_TO_NP_TYPE[attr["to"]])
-        except ImportError as e:
-            raise ImportError("Unable to import onnx.mapping which is required {}".format(e))
+        attr["to"] = get_type(attr["to"])
         return AttrCvt(op_name="cast", transforms={"to": "dtype"})(inputs, attr)
 
 
@@ -1472,6 +1668,13 @@ class Unsqueeze(OnnxOpConverter):
     @classmethod
     def run_calculation(cls, tensor, axes):
         axes = sorted(axes)
+        if len(axes) > 1 and axes[0] >= 0:
+            # Insert all new axes with a single reshape when the input shape is static.
+            new_shape = list(_cached_infer_shape(tensor))
+            if all(isinstance(dim, int) for dim in new_shape):
+                for axis in axes:
+                    new_shape.insert(axis, 1)
+                return _op.reshape(tensor, new_shape)
         for axis in axes:
             tensor = _op.expand_dims(tensor, axis=axis, num_newaxis=1)
         return tensor
@@ -1487,22 +1690,24 @@ class Unsqueeze(OnnxOpConverter):
             constant_axes = list(map(int, constant_axes))
             return cls.run_calculation(inputs[0], constant_axes)
 
-        rank_input = len(infer_type(inputs[0]).checked_type.shape)
-        num_new_axis = int(infer_type(inputs[1]).checked_type.shape[0])
-        axes = relay.split(inputs[1], num_new_axis).astuple()
-        result = inputs[0]
-
-        # TODO (AndrewZhaoLuo): investigate performance issues with consecutive
-        # dynamic expand_dims on non-llvm targets.
-        for i in range(num_new_axis):
-            axis = relay.TupleGetItem(axes, i)
-            # Unpack scalar
-            axis = relay.reshape(axis, [])
-            axis = relay.where(
-                axis >= relay.const(0, "int64"), axis, axis + relay.const(rank_input, "int64")
-            )
-            result = _op.expand_dims(result, axis)
-        return result
+        rank_input = len(_cached_infer_type(inputs[0]).checked_type.shape)
+        num_new_axis = int(_cached_infer_type(inputs[1]).checked_type.shape[0])
+        rank_output = rank_input + num_new_axis
+        if rank_input == 0:
+            # Every output dimension is a new axis of extent 1.
+            return _op.reshape(inputs[0], [1] * rank_output)
+        # Negative axes count from the end of the output.
+        axes = _op.cast(inputs[1], "int64")
+        axes = _op.where(axes >= _int64_const(0), axes, axes + _int64_const(rank_output))
+
+        # Build the output shape in one go rather than chaining a dynamic expand_dims per axis:
+        # new axes get extent 1, every other position takes the next input dimension.
+        positions = _int64_const(tuple(range(rank_output)))
+        is_new = _op.sum(_op.cast(_op.equal(_op.expand_dims(positions, 1), axes), "int64"), axis=1)
+        input_index = positions - _op.cumsum(is_new)
+        input_shape = _op.take(shape_of(inputs[0], dtype="int64"), input_index, mode="clip")
+        newshape = _op.where(is_new > _int64_const(0), _int64_const(1), input_shape)
+        return _op.reshape(inputs[0], newshape)
 
 
 class Squeeze(OnnxOpConverter):
@@ -1516,7 +1721,7 @@ class Squeeze(OnnxOpConverter):
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         axis = inputs[1]
-        dtype = infer_type(axis).checked_type.dtype
+        dtype = _cached_infer_type(axis).checked_type.dtype
 
         if isinstance(axis, _expr.Constant):
             constant_axes = list(inputs[1].data.numpy())
@@ -1524,7 +1729,7 @@ class Squeeze(OnnxOpConverter):
             return _op.squeeze(inputs[0], constant_axes)
 
         rank = _op.shape_of(_op.shape_of(inputs[0], dtype), dtype)
-        axis = _op.where(axis < _op.const(0, dtype), axis + rank, axis)
+        axis = _op.where(axis < _cached_const(0, dtype), axis + rank, axis)
         return _op.squeeze(inputs[0], fold_constant(axis))
 
 
@@ -1593,36 +1798,74 @@ class Slice(OnnxOpConverter):
         axes = inputs[3]
         steps = inputs[4]
 
-        ishape = infer_shape(inputs[0])
+        ishape = _cached_infer_shape(inputs[0])
         data_rank = len(ishape)
 
         def has_static_axes():
             return (
-                isinstance(axes, _expr.Constant)
+                (axes is None or isinstance(axes, _expr.Constant))
                 and isinstance(starts, _expr.Constant)
                 and isinstance(ends, _expr.Constant)
                 and (steps is None or isinstance(steps, _expr.Constant))
             )
 
-        if axes is not None and has_static_axes():
-            axes_np = axes.data.numpy().astype("int64")
+        if has_static_axes():
             begin_np = starts.data.numpy().astype("int64")
             end_np = ends.data.numpy().astype("int64")
+            if axes is None:
+                axes_np = np.arange(len(begin_np), dtype="int64")
+            else:
+                axes_np = axes.data.numpy().astype("int64")
             if steps is None:
                 strides_np = np.ones_like(begin_np).astype("int64")
             else:
                 strides_np = steps.data.numpy().astype("int64")
 
             if all([isinstance(ishape[i], int) for i in axes_np]):
+                # Slices that keep every element along every axis are no-ops.
+                if all(
+                    begin == 0 and end >= ishape[axis] and stride == 1
+                    for axis, begin, end, stride in zip(axes_np, begin_np, end_np, strides_np)
+                ):
+                    return inputs[0]
                 return _op.strided_slice(
                     inputs[0], list(begin_np), list(end_np), list(strides_np), axes=list(axes_np)
                 )
 
         # Update the starts and ends according to axes if required.
-        if axes is not None:
-            data_shape = shape_of(inputs[0], dtype=infer_type(ends).checked_type.dtype)
+        if isinstance(axes, _expr.Constant):
+            # Dynamic strided_slice does not take axes, so expand the parameters to full rank.
+            # With constant axes a static gather does this without any scatter.
+            axes_list = [int(axis) % data_rank for axis in axes.data.numpy()]
+            num_axes = len(axes_list)
+            if axes_list == list(range(num_axes)):
+                # Leading axes need no expansion, as long as steps has the same length.
+                if steps is None:
+                    steps_dtype = _cached_infer_type(starts).checked_type.dtype
+                    steps = _cached_const((1,) * num_axes, steps_dtype)
+            else:
+                index = _op.const(
+                    [
+                        axes_list.index(i) if i in axes_list else num_axes + i
+                        for i in range(data_rank)
+                    ],
+                    dtype="int64",
+                )
+
+                def expand(values, defaults):
+                    return _op.take(_op.concatenate([values, defaults], axis=0), index)
+
+                starts_dtype = _cached_infer_type(starts).checked_type.dtype
+                ends_dtype = _cached_infer_type(ends).checked_type.dtype
+                starts = expand(starts, _cached_const((0,) * data_rank, starts_dtype))
+                ends = expand(ends, shape_of(inputs[0], dtype=ends_dtype))
+                if steps is not None:
+                    steps_dtype = _cached_infer_type(steps).checked_type.dtype
+                    steps = expand(steps, _cached_const((1,) * data_rank, steps_dtype))
+        elif axes is not None:
+            data_shape = shape_of(inputs[0], dtype=_cached_infer_type(ends).checked_type.dtype)
             starts = _op.scatter(
-                _op.const([0] * data_rank, dtype=infer_type(starts).checked_type.dtype),
+                _cached_const((0,) * data_rank, _cached_infer_type(starts).checked_type.dtype),
                 axes,
                 starts,
                 axis=0,
@@ -1630,14 +1873,14 @@ class Slice(OnnxOpConverter):
             ends = _op.scatter(data_shape, axes, ends, axis=0)
             if steps is not None:
                 steps = _op.scatter(
-                    _op.const([1] * data_rank, dtype=infer_type(steps).checked_type.dtype),
+                    _cached_const((1,) * data_rank, _cached_infer_type(steps).checked_type.dtype),
                     axes,
                     steps,
                     axis=0,
                 )
 
         if steps is None:
-            steps = _op.const([1] * data_rank, dtype=infer_type(starts).checked_type.dtype)
+            steps = _cached_const((1,) * data_rank, _cached_infer_type(starts).checked_type.dtype)
 
         return _op.strided_slice(
             inputs[0], fold_constant(starts), fold_constant(ends), fold_constant(steps)
@@ -1646,7 +1889,17 @@ class Slice(OnnxOpConverter):
 
 def normalize_gather_indices(data, indices, axis):
     """Make sure gather indicies aren't negative"""
-    ind_dtype = infer_type(indices).checked_type.dtype
+    ind_dtype = _cached_infer_type(indices).checked_type.dtype
+    if ind_dtype.startswith("uint"):
+        return indices
+    if isinstance(indices, _expr.Constant):
+        val = indices.data.numpy()
+        if val.size == 0 or val.min() >= 0:
+            return indices
+        # Negative constant indices can be wrapped right away if the axis extent is known.
+        dim = _cached_infer_shape(data)[axis]
+        if isinstance(dim, int):
+            return _expr.const(np.where(val < 0, val + dim, val).astype(ind_dtype))
     # Normalize the indices to a positive range
     s = _op.take(_op.shape_of(data, dtype=ind_dtype), _op.const(axis, dtype="int64"))
     cond = fold_constant(indices < _op.const(0, ind_dtype))
@@ -1690,10 +1943,13 @@ class GatherND(OnnxOpConverter):
 
     @classmethod
     def _impl_common(cls, data, indices, batch_dims=0):
-        indices_dims = len(infer_shape(indices))
-        indices_shape = infer_shape(indices)
-        indices = _op.transpose(indices, axes=[-1] + list(range(indices_dims - 1)))
+        indices_shape = _cached_infer_shape(indices)
         index_rank = indices_shape[-1]
+        # Relay expects the index tuples along the first axis rather than the last.
+        if isinstance(indices, _expr.Constant):
+            indices = _expr.const(np.moveaxis(indices.data.numpy(), -1, 0))
+        else:
+            indices = _op.transpose(indices, axes=[-1] + list(range(len(indices_shape) - 1)))
         return _op.gather_nd(
             data,
             indices,
@@ -1721,14 +1977,17 @@ class Compress(OnnxOpConverter):
         axis = attr.get("axis", None)
 
         # Change one hot tensor to indices e.g. [0, 1, 1, 0, 1] -> [1, 2, 4]
-        condition_tensor = _op.reshape(_op.argwhere(condition_tensor), (-1,))
-
-        if axis is not None:
-            return _op.take(input_tensor, condition_tensor, axis=axis)
+        if isinstance(condition_tensor, _expr.Constant):
+            # A constant condition gives static indices, avoiding the dynamic argwhere.
+            condition_tensor = _expr.const(np.flatnonzero(condition_tensor.data.numpy()))
+        else:
+            condition_tensor = _op.reshape(_op.argwhere(condition_tensor), (-1,))
 
-        # if axis is None, flatten input tensor before selection
-        input_tensor = _op.reshape(input_tensor, (-1,))
-        return _op.take(input_tensor, condition_tensor, axis=0)
+        if axis is None:
+            # if axis is None, flatten input tensor before selection
+            input_tensor = _op.reshape(input_tensor, (-1,))
+            axis = 0
+        return _op.take(input_tensor, condition_tensor, axis=axis)
 
 
 class Scatter(OnnxOpConverter):
@@ -1745,11 +2004,14 @@ class ScatterND(OnnxOpConverter):
 
     @classmethod
     def _impl_v11(cls, inputs, attr, params):
-        indices_dim = len(infer_shape(inputs[1]))
-        axes = list(range(indices_dim))
-        return _op.scatter_nd(
-            inputs[0], _op.transpose(inputs[1], axes[-1:] + axes[:-1]), inputs[2], "update"
-        )
+        indices = inputs[1]
+        # Relay expects the index tuples along the first axis rather than the last.
+        if isinstance(indices, _expr.Constant):
+            indices = _expr.const(np.moveaxis(indices.data.numpy(), -1, 0))
+        else:
+            axes = list(range(len(_cached_infer_shape(indices))))
+            indices = _op.transpose(indices, axes[-1:] + axes[:-1])
+        return _op.scatter_nd(inputs[0], indices, inputs[2], "update")
 
 
 class EyeLike(OnnxOpConverter):
@@ -1757,7 +2019,7 @@ class EyeLike(OnnxOpConverter):
 
     @classmethod
     def _impl_v9(cls, inputs, attr, params):
-        in_checked_type = infer_type(inputs[0]).checked_type
+        in_checked_type = _cached_infer_type(inputs[0]).checked_type
         in_dtype = in_checked_type.dtype
         in_shape = list(get_const_tuple(in_checked_type.shape))
         dtype = attr.get("dtype", None)
@@ -1765,11 +2027,14 @@ class EyeLike(OnnxOpConverter):
             dtype = in_dtype
         else:
             dtype = get_type(dtype)
+        k = attr.get("k", 0)
+        if all(isinstance(dim, int) for dim in in_shape):
+            return _expr.const(np.eye(in_shape[0], in_shape[1], k=k, dtype=dtype))
         zeros = _op.zeros(in_shape, dtype)
         dim = in_shape[0]
         indices = _op.arange(_op.const(0), _op.const(dim), dtype="int32")
         ones = _op.full(_op.const(1), (dim,), dtype=dtype)
-        k = _op.const(attr.get("k", 0), dtype="int32")
+        k = _op.const(k, dtype="int32")
         return _op.scatter_nd(zeros, _op.stack([indices, indices + k], axis=0), ones, "update")
 
 
@@ -1795,12 +2060,7 @@ class Maximum(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if len(inputs) == 1:
-            return inputs[0]
-        _max = inputs[0]
-        for i in range(1, len(inputs)):
-            _max = AttrCvt("maximum")([_max, inputs[i]], {})
-        return _max
+        return _reduce_pairwise(_op.maximum, inputs)
 
 
 class Minimum(OnnxOpConverter):
@@ -1808,12 +2068,7 @@ class Minimum(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if len(inputs) == 1:
-            return inputs[0]
-        _min = inputs[0]
-        for i in range(1, len(inputs)):
-            _min = AttrCvt("minimum")([_min, inputs[i]], {})
-        return _min
+        return _reduce_pairwise(_op.minimum, inputs)
 
 
 class Mean(OnnxOpConverter):
@@ -1823,9 +2078,9 @@ class Mean(OnnxOpConverter):
     def _impl_v1(cls, inputs, attr, params):
         if len(inputs) == 1:
             return inputs[0]
-        # avoid overflow
-        concat = _op.concatenate([_op.expand_dims(x, axis=0) for x in inputs], axis=0)
-        return _op.mean(concat, axis=0, keepdims=False)
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
+        total = _reduce_pairwise(_op.add, inputs)
+        return _op.divide(total, _cached_const(len(inputs), dtype))
 
 
 class HardSigmoid(OnnxOpConverter):
@@ -1833,11 +2088,11 @@ class HardSigmoid(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        alpha = attr.get("alpha", 0.2)
-        beta = attr.get("beta", 0.5)
-        transformX = (inputs[0] * _expr.const(alpha)) + _expr.const(beta)
-        attr = {"a_min": 0, "a_max": 1}
-        return AttrCvt("clip")([transformX], attr)
+        alpha = float(attr.get("alpha", 0.2))
+        beta = float(attr.get("beta", 0.5))
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
+        transformX = inputs[0] * _cached_const(alpha, dtype) + _cached_const(beta, dtype)
+        return _op.clip(transformX, 0, 1)
 
 
 class Reduce(OnnxOpConverter):
@@ -1852,25 +2107,26 @@ class Reduce(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if "axes" in attr:
-            axis = attr.get("axes", 0)
-        else:
-            axis_len = len(infer_shape(inputs[0]))
-            axis = list(range(axis_len))
-
+        axis = _get_reduce_axis(inputs[0], attr)
         return cls.run_calculation(inputs, axis, attr.get("keepdims", True))
 
     @classmethod
     def _impl_v12(cls, inputs, attr, params):
         if len(inputs) == 2:
             if isinstance(inputs[1], _expr.Constant):
-                # Get axis and unpack scalar
-                constant_axis = int(inputs[1].data.numpy()[0])
-                return cls.run_calculation([inputs[0]], constant_axis, attr.get("keepdims", True))
+                axes = inputs[1].data.numpy()
+            elif isinstance(inputs[1], _expr.Var) and inputs[1].name_hint in params:
+                axes = params[inputs[1].name_hint].numpy()
+            else:
+                raise ValueError("Dynamic Reduce is not supported yet!")
 
-            raise ValueError("Dynamic Reduce is not supported yet!")
+            axes = axes.astype("int64").flatten().tolist()
+            if axes:
+                return cls.run_calculation([inputs[0]], axes, attr.get("keepdims", True))
+            if attr.get("noop_with_empty_axes", 0):
+                return inputs[0]
 
-        return cls._impl_v1(inputs, attr, params)
+        return cls._impl_v1(inputs[:1], attr, params)
 
 
 class ReduceMax(Reduce):
@@ -1914,15 +2170,8 @@ class ReduceSumSquare(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if "axes" in attr:
-            axis = attr.get("axes", 0)
-        else:
-            axis_len = len(infer_shape(inputs[0]))
-            axis = list(range(axis_len))
-        attr = {"axis": axis, "keepdims": attr.get("keepdims", True)}
-        inputs[0] = inputs[0] * inputs[0]
-
-        return AttrCvt("sum")(inputs, attr)
+        axis = _get_reduce_axis(inputs[0], attr)
+        return _op.sum(inputs[0] * inputs[0], axis, attr.get("keepdims", True))
 
 
 class ReduceL1(OnnxOpConverter):
@@ -1930,15 +2179,8 @@ class ReduceL1(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if "axes" in attr:
-            axis = attr.get("axes", 0)
-        else:
-            axis_len = len(infer_shape(inputs[0]))
-            axis = list(range(axis_len))
-        attr = {"axis": axis, "keepdims": attr.get("keepdims", True)}
-        inputs[0] = _op.abs(inputs[0])
-
-        return AttrCvt("sum")(inputs, attr)
+        axis = _get_reduce_axis(inputs[0], attr)
+        return _op.sum(_op.abs(inputs[0]), axis, attr.get("keepdims", True))
 
 
 class ReduceL2(OnnxOpConverter):
@@ -1946,16 +2188,8 @@ class ReduceL2(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if "axes" in attr:
-            axis = attr.get("axes", 0)
-        else:
-            axis_len = len(infer_shape(inputs[0]))
-            axis = list(range(axis_len))
-        attr = {"axis": axis, "keepdims": attr.get("keepdims", True)}
-        inputs[0] = inputs[0] * inputs[0]
-        out = AttrCvt("sum")(inputs, attr)
-
-        return _op.sqrt(out)
+        axis = _get_reduce_axis(inputs[0], attr)
+        return _op.sqrt(_op.sum(inputs[0] * inputs[0], axis, attr.get("keepdims", True)))
 
 
 class ReduceLogSum(OnnxOpConverter):
@@ -1963,15 +2197,8 @@ class ReduceLogSum(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        if "axes" in attr:
-            axis = attr.get("axes", 0)
-        else:
-            axis_len = len(infer_shape(inputs[0]))
-            axis = list(range(axis_len))
-        attr = {"axis": axis, "keepdims": attr.get("keepdims", True)}
-        out = AttrCvt("sum")(inputs, attr)
-
-        return _op.log(out)
+        axis = _get_reduce_axis(inputs[0], attr)
+        return _op.log(_op.sum(inputs[0], axis, attr.get("keepdims", True)))
 
 
 class ArgMax(OnnxOpConverter):
@@ -2004,26 +2231,24 @@ class Softmax(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         axis = attr.get("axis", 1)
-        ndim = len(infer_shape(inputs[0]))
+        ndim = len(_cached_infer_shape(inputs[0]))
         if axis < 0:
             axis += ndim
-        axes = list(range(axis, ndim))
         x = inputs[0]
-        m = _op.max(x, axes, keepdims=True)
-        e = _op.exp(x - m)
-        return e / _op.sum(e, axes, keepdims=True)
+        if axis == ndim - 1:
+            return _op.nn.softmax(x, axis=axis)
+        # Before opset 13 all the axes from axis on are normalized together,
+        # so fold them into one, run a single softmax over it and restore the shape.
+        out = _op.nn.softmax(_op.reshape(x, [0] * axis + [-1]), axis=axis)
+        return _op.reshape_like(out, x)
 
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         axis = attr.get("axis", -1)
-        ndim = len(infer_shape(inputs[0]))
+        ndim = len(_cached_infer_shape(inputs[0]))
         if axis < 0:
             axis += ndim
-        axes = [axis]
-        x = inputs[0]
-        m = _op.max(x, axes, keepdims=True)
-        e = _op.exp(x - m)
-        return e / _op.sum(e, axes, keepdims=True)
+        return _op.nn.softmax(inputs[0], axis=axis)
 
 
 class LogSoftmax(OnnxOpConverter):
@@ -2032,15 +2257,12 @@ class LogSoftmax(OnnxOpConverter):
     @classmethod
     def run_calculation(cls, x, axes):
         """Run the calculation for Log Softmax calculation."""
-        m = _op.max(x, axes, keepdims=True)
-        e = _op.exp(x - m)
-        s = _op.sum(e, axes, keepdims=True)
-        return x - m - _op.log(s)
+        return x - _op.logsumexp(x, axes, keepdims=True)
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         axis = attr.get("axis", 1)
-        ndim = len(infer_shape(inputs[0]))
+        ndim = len(_cached_infer_shape(inputs[0]))
         if axis < 0:
             axis += ndim
         axes = list(range(axis, ndim))
@@ -2049,7 +2271,7 @@ class LogSoftmax(OnnxOpConverter):
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         axis = attr.get("axis", -1)
-        ndim = len(infer_shape(inputs[0]))
+        ndim = len(_cached_infer_shape(inputs[0]))
         if axis < 0:
             axis += ndim
         axes = [axis]
@@ -2062,10 +2284,22 @@ class Hardmax(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         axis = attr.get("axis", 1)
-        ndim = len(infer_shape(inputs[0]))
+        in_shape = _cached_infer_shape(inputs[0])
+        ndim = len(in_shape)
         if axis < 0:
             axis += ndim
-        dtype = infer_type(inputs[0]).checked_type.dtype
+        dtype = _cached_infer_type(inputs[0]).checked_type.dtype
+
+        if all(isinstance(dim, int) for dim in in_shape):
+            # Static shape: coerce to 2D with Python ints, skipping the shape_of subgraph.
+            pre = int(np.prod(in_shape[:axis]))
+            post = int(np.prod(in_shape[axis:]))
+            x = _op.reshape(inputs[0], (pre, post))
+            argmax = _op.argmax(x, axis=1)
+            onehot = _op.one_hot(
+                argmax, _op.const(1.0, dtype), _op.const(0.0, dtype), post, 1, dtype
+            )
+            return _op.reshape(onehot, in_shape)
 
         if axis == 0:
             pre = _op.const([1], "int64")
@@ -2091,7 +2325,7 @@ class Hardmax(OnnxOpConverter):
 
     @classmethod
     def _impl_v13(cls, inputs, attr, params) -> relay.Expr:
-        inferred_type = infer_type(inputs[0])
+        inferred_type = _cached_infer_type(inputs[0])
         dtype = inferred_type.checked_type.dtype
         ndim = len(inferred_type.checked_type.shape)
         axis = attr.get("axis", -1) % ndim
@@ -2114,16 +2348,20 @@ class OneHot(OnnxOpConverter):
     def _impl_v9(cls, inputs, attr, params):
         # Extract relay one_hot inputs.
         indices, depth, values = inputs
-        ndim = len(infer_shape(indices))
+        ndim = len(_cached_infer_shape(indices))
         # Split onnx on off values into two separate expressions.
         off_value, on_value = _op.take(values, _op.const(0)), _op.take(values, _op.const(1))
         # Extract the datatype of the output from on_value.
-        dtype = infer_type(on_value).checked_type.dtype
-        ind_dtype = infer_type(indices).checked_type.dtype
-        # Normalize the indices to a positive range
-        indices = _op.where(
-            indices < _op.const(0, ind_dtype), indices + _op.cast(depth, ind_dtype), indices
-        )
+        dtype = _cached_infer_type(on_value).checked_type.dtype
+        ind_dtype = _cached_infer_type(indices).checked_type.dtype
+        # Normalize the indices to a positive range, unless they are known to be non-negative
+        if not (
+            ind_dtype.startswith("uint")
+            or (isinstance(indices, _expr.Constant) and (indices.data.numpy() >= 0).all())
+        ):
+            indices = _op.where(
+                indices < _op.const(0, ind_dtype), indices + _op.cast(depth, ind_dtype), indices
+            )
         # set default value when axis is not set in the model
         if "axis" not in attr:
             attr["axis"] = -1
@@ -2144,8 +2382,14 @@ class ConstantOfShape(OnnxOpConverter):
             value = _expr.const(np_value)
             dtype = np_value.dtype.name
         else:
+            np_value = 0
             value = _expr.const(0)
             dtype = "float32"
+        if isinstance(inputs[0], _expr.Constant):
+            shape = tuple(inputs[0].data.numpy().astype("int64").tolist())
+            # Only embed small outputs as literals; larger ones stay a runtime fill.
+            if np.prod(shape) <= 1 << 16:
+                return _expr.const(np.full(shape, np_value, dtype=dtype))
         output = _op.full(value, inputs[0], dtype=dtype)
         return output
 
@@ -2221,28 +2465,8 @@ class Where(OnnxOpConverter):
 
     @classmethod
     def _impl_v9(cls, inputs, attr, params):
-        condition_rank = len(infer_shape(inputs[0]))
-        x_rank = len(infer_shape(inputs[1]))
-        y_rank = len(infer_shape(inputs[2]))
-        ranks = [condition_rank, x_rank, y_rank]
-
-        # If one rank is longer than others, then we can broadcast
-        # to that shape.
-        max_rank = max(ranks)
-        max_rank_idxs = [i for i, x in enumerate(ranks) if x == max_rank]
-        broadcast_shape = shape_of(inputs[max_rank_idxs[0]])
-        # If two or more inputs have the same rank, compute the broadcast
-        # shape by taking the maximum value of each dimensions.
-        if len(max_rank_idxs) > 1:
-            for idx in max_rank_idxs:
-                broadcast_shape = _op.maximum(broadcast_shape, shape_of(inputs[idx]))
-
-        broadcast_shape = fold_constant(broadcast_shape)
-
-        condition = _op.broadcast_to(inputs[0], broadcast_shape)
-        x = _op.broadcast_to(inputs[1], broadcast_shape)
-        y = _op.broadcast_to(inputs[2], broadcast_shape)
-        return _op.where(condition, x, y)
+        # Relay's where broadcasts multidirectionally, matching ONNX semantics.
+        return _op.where(inputs[0], inputs[1], inputs[2])
 
 
 class Or(Elemwise):
@@ -2258,9 +2482,11 @@ class Expand(OnnxOpConverter):
 
     @classmethod
     def _impl_v8(cls, inputs, attr, params):
-        dtype = infer_type(inputs[1]).checked_type.dtype
-        in_shape = shape_of(inputs[0], dtype=dtype)
+        dtype = _cached_infer_type(inputs[1]).checked_type.dtype
+        static_in_shape = _cached_infer_shape(inputs[0])
         shape = inputs[1]
+        in_dims = len(static_in_shape)
+        new_dims = _cached_infer_shape(shape)[0]
 
         # Currently 'op.broadcast_to' expect the rank of the given 'shape'
         # (the 2nd input) is always higher than that of the given 'input' (the 1st input)
@@ -2269,47 +2495,30 @@ class Expand(OnnxOpConverter):
         # extent of 'input'. In this case, the extent of 'shape' must be 1.
         # https://github.com/onnx/onnx/blob/master/docs/Broadcasting.md
         # In above cases, we cannot directorly apply 'op.broadcast_to' instead of 'expand'
-        # so, here we solved this problem by expanding the given 'shape' itself.
-        def expand_shape(in_shape, shape):
-            """A function expands the shape when the rank is lower than that of the given
-            intput. Also it replaces the extent of the shape with the corresponding extent
-            of the intput when it is 1.
-            """
-            in_dims = infer_shape(in_shape)[0]
-            new_dims = infer_shape(shape)[0]
-
-            if in_dims < new_dims:
-                in_shape = _op.concatenate(
-                    [
-                        _expr.const(
-                            [
-                                1,
-                            ]
-                            * (new_dims - in_dims),
-                            dtype=dtype,
-                        ),
-                        in_shape,
-                    ],
-                    axis=0,
-                )
-            elif new_dims > in_dims:
-                shape = _op.concatenate(
-                    [
-                        _expr.const(
-                            [
-                                1,
-                            ]
-                            * (in_dims - new_dims),
-                            dtype=dtype,
-                        ),
-                        shape,
-                    ],
-                    axis=0,
-                )
-            new_shape = _op.maximum(in_shape, shape)
-            return new_shape
+        # so, here we solved this problem by expanding the given 'shape' itself: both shapes
+        # are left padded with ones to the same rank and combined with an elementwise maximum.
+        if isinstance(shape, _expr.Constant) and all(
+            isinstance(dim, int) for dim in static_in_shape
+        ):
+            np_in_shape = np.array(static_in_shape, "int64")
+            np_shape = shape.data.numpy().astype("int64")
+            out_dims = max(in_dims, new_dims)
+            new_shape = np.maximum(
+                np.pad(np_in_shape, (out_dims - in_dims, 0), constant_values=1),
+                np.pad(np_shape, (out_dims - new_dims, 0), constant_values=1),
+            )
+            return _op.broadcast_to(inputs[0], shape=new_shape.tolist())
 
-        shape = fold_constant(expand_shape(in_shape, shape))
+        in_shape = shape_of(inputs[0], dtype=dtype)
+        if in_dims < new_dims:
+            in_shape = _op.concatenate(
+                [_expr.const([1] * (new_dims - in_dims), dtype=dtype), in_shape], axis=0
+            )
+        elif in_dims > new_dims:
+            shape = _op.concatenate(
+                [_expr.const([1] * (in_dims - new_dims), dtype=dtype), shape], axis=0
+            )
+        shape = fold_constant(_op.maximum(in_shape, shape))
         return _op.broadcast_to(inputs[0], shape=shape)
 
 
@@ -2324,7 +2533,7 @@ class RNN(OnnxOpConverter):
             attrs["alpha"] = alpha
         if beta is not None:
             attrs["beta"] = beta
-        return lambda x: convert_map[activation.decode("utf-8")]([x], attrs, {})
+        return lambda x: convert_map[activation]([x], attrs, {})
 
     @classmethod
     def _activation_needs_alpha(cls, activation):
@@ -2336,7 +2545,7 @@ class RNN(OnnxOpConverter):
             "HardSigmoid",
             "Elu",
         ]
-        return activation.decode("utf-8") in needs_alpha
+        return activation in needs_alpha
 
     @classmethod
     def _activation_needs_beta(cls, activation):
@@ -2345,7 +2554,42 @@ class RNN(OnnxOpConverter):
             "ScaledTanh",
             "HardSigmoid",
         ]
-        return activation.decode("utf-8") in needs_beta
+        return activation in needs_beta
+
+    @classmethod
+    def _unstack_directions(cls, x, num_directions):
+        """Split x along its leading num_directions axis into per direction tensors.
+
+        Each direction is taken directly, so there is one op per direction instead of
+        a split followed by a squeeze.
+        """
+        if num_directions == 1:
+            return [_op.squeeze(x, axis=[0])]
+        return [_op.take(x, _op.const(i), axis=0) for i in range(num_directions)]
+
+    @classmethod
+    def _stack_bidirectional_outputs(cls, forward_outputs, reverse_outputs):
+        """Stack per step outputs to (seq_len, 2, batch_size, hidden_size).
+
+        The reverse cell yields its outputs last step first, so the list is flipped
+        in Python rather than emitting a stack per step.
+        """
+        return _op.stack(
+            [_op.stack(forward_outputs, axis=0), _op.stack(reverse_outputs[::-1], axis=0)],
+            axis=1,
+        )
+
+    @classmethod
+    def _reorder_gates(cls, weight, hidden_size, gate_order):
+        """Reorder the gates stacked along the first axis of an RNN weight or bias."""
+        if isinstance(hidden_size, int):
+            # A single gather with a constant index instead of a split and a concatenate.
+            index = np.concatenate(
+                [np.arange(gate * hidden_size, (gate + 1) * hidden_size) for gate in gate_order]
+            )
+            return _op.take(weight, _expr.const(index.astype("int64")), axis=0)
+        gates = _op.split(weight, len(gate_order))
+        return _op.concatenate([gates[gate] for gate in gate_order], axis=0)
 
 
 class LSTM(RNN):
@@ -2361,7 +2605,6 @@ class LSTM(RNN):
         """
         Bidirectional LSTM cell
         """
-        seq_len = len(input_seqs)
         forward_outputs, fw_H_t, fw_C_t = lstm_cell(
             input_seqs,
             **weight_dicts[0],
@@ -2379,14 +2622,8 @@ class LSTM(RNN):
             backwards=True,
         )
 
-        final_outputs = []
-        for i in range(seq_len):
-            final_outputs.append(
-                _op.stack([forward_outputs[i], reverse_outputs[seq_len - 1 - i]], axis=0)
-            )
-
         return (
-            _op.stack(final_outputs, axis=0),
+            cls._stack_bidirectional_outputs(forward_outputs, reverse_outputs),
             _op.stack([fw_H_t, rev_H_t], axis=0),
             _op.stack([fw_C_t, rev_C_t], axis=0),
         )
@@ -2404,14 +2641,14 @@ class LSTM(RNN):
         Cp_0 = inputs[6]
         Pp = inputs[7]
 
-        num_directions = infer_shape(Wp)[0]
-        W_dtype = infer_type(Wp).checked_type.dtype
+        num_directions = _cached_infer_shape(Wp)[0]
+        W_dtype = _cached_infer_type(Wp).checked_type.dtype
 
         if num_directions not in [1, 2]:
             raise ValueError("num_directions must be either 1 or 2!")
 
-        X_shape = infer_shape(X)
-        hidden_size = infer_shape(Rp)[-1]
+        X_shape = _cached_infer_shape(X)
+        hidden_size = _cached_infer_shape(Rp)[-1]
         batch_size = X_shape[1]
 
         # Initialize state if not provided.
@@ -2453,42 +2690,45 @@ class LSTM(RNN):
         # TODO (vvchernov): It can be replaced by _op.split if issue #8412 is resolved
         X_steps = unbind(X, axis=0)
 
-        H_ts = _op.split(Hp_0, num_directions)
-        C_ts = _op.split(Cp_0, num_directions)
-        Ws = _op.split(Wp, num_directions)
-        Rs = _op.split(Rp, num_directions)
+        H_ts = cls._unstack_directions(Hp_0, num_directions)
+        C_ts = cls._unstack_directions(Cp_0, num_directions)
+        Ws = cls._unstack_directions(Wp, num_directions)
+        Rs = cls._unstack_directions(Rp, num_directions)
 
         if Bp is not None:
-            Bs = _op.split(Bp, num_directions)
+            Bs = cls._unstack_directions(Bp, num_directions)
         if Pp is not None:
-            p_i, p_o, p_f = _op.split(Pp, 3, axis=1)
-
-            p_is = _op.split(p_i, num_directions)
-            p_fs = _op.split(p_f, num_directions)
-            p_os = _op.split(p_o, num_directions)
+            P_value = None
+            if isinstance(Pp, _expr.Constant):
+                P_value = Pp.data.numpy()
+            elif isinstance(Pp, _expr.Var) and Pp.name_hint in params:
+                P_value = params[Pp.name_hint].numpy()
+            if P_value is not None:
+                # Split known peepholes by direction and gate at conversion time.
+                Ps = [[_expr.const(p) for p in np.split(P, 3)] for P in P_value]
+            else:
+                Ps = [_op.split(P, 3) for P in cls._unstack_directions(Pp, num_directions)]
 
         weights_dicts = []
         for i in range(num_directions):
             weights_dict = {}
 
-            weights_dict["hidden_state"] = _op.squeeze(H_ts[i], axis=[0])
-            weights_dict["cell_state"] = _op.squeeze(C_ts[i], axis=[0])
+            weights_dict["hidden_state"] = H_ts[i]
+            weights_dict["cell_state"] = C_ts[i]
 
             # Weights permutation: onnx format i-o-f-c, lstm cell format i-f-c-o
-            mati, mato, matf, matc = _op.split(_op.squeeze(Ws[i], axis=[0]), 4)
-            weights_dict["w_inp"] = _op.concatenate([mati, matf, matc, mato], axis=0)
-            mati, mato, matf, matc = _op.split(_op.squeeze(Rs[i], axis=[0]), 4)
-            weights_dict["w_hid"] = _op.concatenate([mati, matf, matc, mato], axis=0)
+            gate_order = [0, 2, 3, 1]
+            weights_dict["w_inp"] = cls._reorder_gates(Ws[i], hidden_size, gate_order)
+            weights_dict["w_hid"] = cls._reorder_gates(Rs[i], hidden_size, gate_order)
             if Bp is not None:
                 Bi, Bh = _op.split(Bs[i], 2, -1)
-                mati, mato, matf, matc = _op.split(_op.squeeze(Bi, axis=[0]), 4)
-                weights_dict["b_inp"] = _op.concatenate([mati, matf, matc, mato], axis=0)
-                mati, mato, matf, matc = _op.split(_op.squeeze(Bh, axis=[0]), 4)
-                weights_dict["b_hid"] = _op.concatenate([mati, matf, matc, mato], axis=0)
+                weights_dict["b_inp"] = cls._reorder_gates(Bi, hidden_size, gate_order)
+                weights_dict["b_hid"] = cls._reorder_gates(Bh, hidden_size, gate_order)
             if Pp is not None:
-                weights_dict["p_i"] = _op.squeeze(p_is[i], axis=[0])
-                weights_dict["p_f"] = _op.squeeze(p_fs[i], axis=[0])
-                weights_dict["p_o"] = _op.squeeze(p_os[i], axis=[0])
+                p_i, p_o, p_f = Ps[i]
+                weights_dict["p_i"] = p_i
+                weights_dict["p_f"] = p_f
+                weights_dict["p_o"] = p_o
             weights_dicts.append(weights_dict)
 
         if num_directions == 2:
@@ -2528,7 +2768,6 @@ class GRU(RNN):
         """
         Bidirectional GRU cell
         """
-        seq_len = len(input_seqs)
         forward_outputs, fw_H_t = gru_cell(
             input_seqs,
             **weight_dicts[0],
@@ -2544,14 +2783,8 @@ class GRU(RNN):
             backwards=True,
         )
 
-        final_outputs = []
-        for i in range(seq_len):
-            final_outputs.append(
-                _op.stack([forward_outputs[i], reverse_outputs[seq_len - 1 - i]], axis=0)
-            )
-
         return (
-            _op.stack(final_outputs, axis=0),
+            cls._stack_bidirectional_outputs(forward_outputs, reverse_outputs),
             _op.stack([fw_H_t, rev_H_t], axis=0),
         )
 
@@ -2567,14 +2800,14 @@ class GRU(RNN):
         Hp_0 = inputs[5]
         linear_before_reset = attr.get("linear_before_reset", 0)
 
-        num_directions = infer_shape(Wp)[0]
-        W_dtype = infer_type(Wp).checked_type.dtype
+        num_directions = _cached_infer_shape(Wp)[0]
+        W_dtype = _cached_infer_type(Wp).checked_type.dtype
 
         if num_directions not in [1, 2]:
             raise ValueError("num_directions must be either 1 or 2!")
 
-        X_shape = infer_shape(X)
-        hidden_size = infer_shape(Rp)[-1]
+        X_shape = _cached_infer_shape(X)
+        hidden_size = _cached_infer_shape(Rp)[-1]
         batch_size = X_shape[1]
 
         if Hp_0 is None:
@@ -2612,31 +2845,28 @@ class GRU(RNN):
         # TODO (vvchernov): It can be replaced by _op.split if issue #8412 is resolved
         X_steps = unbind(X, axis=0)
 
-        H_ts = _op.split(Hp_0, num_directions)
-        Ws = _op.split(Wp, num_directions)
-        Rs = _op.split(Rp, num_directions)
+        H_ts = cls._unstack_directions(Hp_0, num_directions)
+        Ws = cls._unstack_directions(Wp, num_directions)
+        Rs = cls._unstack_directions(Rp, num_directions)
 
         if Bp is not None:
-            Bs = _op.split(Bp, num_directions)
+            Bs = cls._unstack_directions(Bp, num_directions)
 
         weights_dicts = []
         for i in range(num_directions):
             weights_dict = {}
 
-            weights_dict["hidden_state"] = _op.squeeze(H_ts[i], axis=[0])
+            weights_dict["hidden_state"] = H_ts[i]
             weights_dict["linear_before_reset"] = linear_before_reset
 
-            # Weights permutation: onnx format i-o-f-c, lstm cell format i-f-c-o
-            matz, matr, matn = _op.split(_op.squeeze(Ws[i], axis=[0]), 3)
-            weights_dict["w_inp"] = _op.concatenate([matr, matz, matn], axis=0)
-            matz, matr, matn = _op.split(_op.squeeze(Rs[i], axis=[0]), 3)
-            weights_dict["w_hid"] = _op.concatenate([matr, matz, matn], axis=0)
+            # Weights permutation: onnx format z-r-n, gru cell format r-z-n
+            gate_order = [1, 0, 2]
+            weights_dict["w_inp"] = cls._reorder_gates(Ws[i], hidden_size, gate_order)
+            weights_dict["w_hid"] = cls._reorder_gates(Rs[i], hidden_size, gate_order)
             if Bp is not None:
                 Bi, Bh = _op.split(Bs[i], 2, -1)
-                matz, matr, matn = _op.split(_op.squeeze(Bi, axis=[0]), 3)
-                weights_dict["b_inp"] = _op.concatenate([matr, matz, matn], axis=0)
-                matz, matr, matn = _op.split(_op.squeeze(Bh, axis=[0]), 3)
-                weights_dict["b_hid"] = _op.concatenate([matr, matz, matn], axis=0)
+                weights_dict["b_inp"] = cls._reorder_gates(Bi, hidden_size, gate_order)
+                weights_dict["b_hid"] = cls._reorder_gates(Bh, hidden_size, gate_order)
             weights_dicts.append(weights_dict)
 
         if num_directions == 2:
@@ -2666,7 +2896,7 @@ class Resize(OnnxOpConverter):
 
     @classmethod
     def _impl_v10(cls, inputs, attr, params):
-        mode = attr.get("mode").decode("ascii")
+        mode = attr.get("mode")
         if mode == "nearest":
             method = "nearest_neighbor"
         elif mode == "linear":
@@ -2679,26 +2909,23 @@ class Resize(OnnxOpConverter):
             )
 
         scale = inputs[1]
-        size = _op.cast(shape_of(inputs[0]), infer_type(scale).checked_type.dtype) * scale
-        ndims = len(infer_shape(inputs[0]))
-        out = None
+        size = _op.cast(shape_of(inputs[0]), _infer_dtype(scale)) * scale
+        ndims = len(_cached_infer_shape(inputs[0]))
+        if ndims not in (3, 4, 5):
+            raise NotImplementedError("Resize only supports 3, 4, or 5 dims")
+        out_size = fold_constant(_op.strided_slice(size, [2], [ndims]))
         if ndims == 3:
-            out_size = fold_constant(_op.strided_slice(size, [2], [3]))
             out = _op.image.resize1d(inputs[0], out_size, "NCW", method, "asymmetric")
         elif ndims == 4:
-            out_size = fold_constant(_op.strided_slice(size, [2], [4]))
             out = _op.image.resize2d(inputs[0], out_size, "NCHW", method, "asymmetric")
-        elif ndims == 5:
-            out_size = fold_constant(_op.strided_slice(size, [2], [5]))
-            out = _op.image.resize3d(inputs[0], out_size, "NCDHW", method, "asymmetric")
         else:
-            raise NotImplementedError("Resize only supports 3, 4, or 5 dims")
+            out = _op.image.resize3d(inputs[0], out_size, "NCDHW", method, "asymmetric")
         return out
 
     @classmethod
     def _impl_v11(cls, inputs, attr, params):
         scale = inputs[2]
-        scale_shape = infer_shape(scale)
+        scale_shape = _cached_infer_shape(scale)
         if len(inputs) == 4:
             assert (
                 len(scale_shape) == 0 or scale_shape[0] == 0
@@ -2706,7 +2933,8 @@ class Resize(OnnxOpConverter):
             size = inputs[3]
         else:
             assert len(scale_shape) != 0, "One of scale or size should be passed."
-            size = _op.cast(shape_of(inputs[0]), infer_type(scale).checked_type.dtype) * scale
+            scale_dtype = _infer_dtype(scale)
+            size = _op.cast(shape_of(inputs[0]), scale_dtype) * scale
         return cls.v11_13_common(inputs, size, attr, params)
 
     @classmethod
@@ -2716,7 +2944,7 @@ class Resize(OnnxOpConverter):
         if size is not None:
             assert scale is None, "One of scale or size should be passed, not both."
         else:
-            scale_type = infer_type(scale)
+            scale_type = _cached_infer_type(scale)
             scale_shape = scale_type.checked_type.shape
             scale_dtype = scale_type.checked_type.dtype
             assert len(scale_shape) != 0, "One of scale or size should be passed."
@@ -2731,8 +2959,8 @@ class Resize(OnnxOpConverter):
         they handle the passing of scale and size. This utility
         provides the implementation for both
         """
-        ndims = len(infer_shape(inputs[0]))
-        mode = attr.get("mode").decode("ascii")
+        ndims = len(_cached_infer_shape(inputs[0]))
+        mode = attr.get("mode")
         if mode == "nearest":
             method = "nearest_neighbor"
         elif mode == "linear":
@@ -2744,30 +2972,26 @@ class Resize(OnnxOpConverter):
                 'Value {} in attribute "mode" of operator Resize is not valid.'.format(mode)
             )
 
-        coord_trans = attr.get("coordinate_transformation_mode", b"half_pixel").decode("ascii")
-        nearest_mode = attr.get("nearest_mode", b"round_prefer_floor").decode("ascii")
+        coord_trans = attr.get("coordinate_transformation_mode", "half_pixel")
+        nearest_mode = attr.get("nearest_mode", "round_prefer_floor")
         alpha = attr.get("cubic_coeff_a", -0.75)
         exclude = attr.get("exclude_outside", 0)
 
-        out_size = fold_constant(_op.strided_slice(size, [2], [4]))
-        out = None
+        if ndims not in (3, 4, 5):
+            raise NotImplementedError("Resize only supports 3, 4, or 5 dims")
+        out_size = fold_constant(_op.strided_slice(size, [2], [ndims]))
         if ndims == 3:
-            out_size = fold_constant(_op.strided_slice(size, [2], [3]))
             out = _op.image.resize1d(
                 inputs[0], out_size, "NCW", method, coord_trans, nearest_mode, alpha, exclude
             )
         elif ndims == 4:
-            out_size = fold_constant(_op.strided_slice(size, [2], [4]))
             out = _op.image.resize2d(
                 inputs[0], out_size, "NCHW", method, coord_trans, nearest_mode, alpha, exclude
             )
-        elif ndims == 5:
-            out_size = fold_constant(_op.strided_slice(size, [2], [5]))
+        else:
             out = _op.image.resize3d(
                 inputs[0], out_size, "NCDHW", method, coord_trans, nearest_mode, alpha, exclude
             )
-        else:
-            raise NotImplementedError("Resize only supports 3, 4, or 5 dims")
 
         return out
 
@@ -2804,36 +3028,7 @@ class TopK(OnnxOpConverter):
             raise ValueError("Expect 2 input only")
         axis = attr.get("axis", -1)
         largest = attr.get("largest", 1)
-
-        if largest == 0:
-            # TODO(mbrookhart): optimize this by adding a smallest attribute to topi if this
-            # ever becomes a bottleneck
-            ndim = len(infer_shape(inputs[0]))
-            if axis < 0:
-                axis += ndim
-            sort = _op.sort(inputs[0], axis=axis)
-            argsort = _op.argsort(inputs[0], axis=axis, dtype="int64")
-            begin = [0] * ndim
-            stride = [1] * ndim
-            end = _op.concatenate(
-                [
-                    _op.const([np.iinfo(np.int64).max] * axis, dtype="int64"),
-                    inputs[1],
-                    _op.const([np.iinfo(np.int64).max] * (ndim - axis - 1), dtype="int64"),
-                ],
-                axis=0,
-            )
-            return _expr.TupleWrapper(
-                _expr.Tuple(
-                    [
-                        _op.strided_slice(sort, begin, end, stride),
-                        _op.strided_slice(argsort, begin, end, stride),
-                    ]
-                ),
-                2,
-            )
-
-        return _op.topk(inputs[0], inputs[1], axis=axis, dtype="int64")
+        return _op.topk(inputs[0], inputs[1], axis=axis, is_ascend=largest == 0, dtype="int64")
 
 
 class Range(OnnxOpConverter):
@@ -2844,9 +3039,7 @@ class Range(OnnxOpConverter):
         if len(inputs) != 3:
             raise ValueError("Expect 3 input only")
 
-        return _op.arange(
-            inputs[0], inputs[1], inputs[2], dtype=infer_type(inputs[0]).checked_type.dtype
-        )
+        return _op.arange(inputs[0], inputs[1], inputs[2], dtype=_infer_dtype(inputs[0]))
 
 
 class IsInf(OnnxOpConverter):
@@ -2856,12 +3049,12 @@ class IsInf(OnnxOpConverter):
     def _impl_v10(cls, inputs, attr, params):
         detect_negative = attr.get("detect_negative", 1)
         detect_positive = attr.get("detect_positive", 1)
-        dtype = infer_type(inputs[0]).checked_type.dtype
+        dtype = _infer_dtype(inputs[0])
         isinf = _op.isinf(inputs[0])
         if not detect_negative:
-            isinf = isinf * (inputs[0] > _op.const(0, dtype))
+            isinf = _op.logical_and(isinf, _op.greater(inputs[0], _cached_const(0, dtype)))
         if not detect_positive:
-            isinf = isinf * (inputs[0] < _op.const(0, dtype))
+            isinf = _op.logical_and(isinf, _op.less(inputs[0], _cached_const(0, dtype)))
         return isinf
 
 
@@ -2871,12 +3064,13 @@ class Celu(OnnxOpConverter):
     @classmethod
     def _impl_v12(cls, inputs, attr, params):
         x = inputs[0]
-        dtype = infer_type(x).checked_type.dtype
-        alpha = _op.const(attr.get("alpha", 1.0), dtype)
-        zero = _op.const(0, dtype)
-        one = _op.const(1, dtype)
-        out = _op.maximum(zero, x) + _op.minimum(zero, alpha * (_op.exp(x / alpha) - one))
-        return out
+        dtype = _infer_dtype(x)
+        alpha = _cached_const(float(attr.get("alpha", 1.0)), dtype)
+        one = _cached_const(1, dtype)
+        # Since alpha > 0, min(0, alpha * (exp(x / alpha) - 1)) equals
+        # alpha * (exp(min(x, 0) / alpha) - 1), which keeps exp from overflowing.
+        negative_part = alpha * (_op.exp(_op.minimum(x, _cached_const(0, dtype)) / alpha) - one)
+        return _op.nn.relu(x) + negative_part
 
 
 class MaxRoiPool(OnnxOpConverter):
@@ -2904,8 +3098,8 @@ class RoiAlign(OnnxOpConverter):
         x = inputs[0]
         rois = inputs[1]
         batch_indices = inputs[2]
-        mode = attr.get("mode", b"avg")
-        if mode not in (b"avg", b"max"):
+        mode = attr.get("mode", "avg")
+        if mode not in ("avg", "max"):
             raise NotImplementedError("RoiAlign in Relay only uses avg and max modes")
         output_height = attr.get("output_height", 1)
         output_width = attr.get("output_width", 1)
@@ -2914,7 +3108,7 @@ class RoiAlign(OnnxOpConverter):
         spatial_scale = attr.get("spatial_scale", 1.0)
 
         batch_indices = _op.expand_dims(batch_indices, axis=1, num_newaxis=1)
-        batch_indices = _op.cast(batch_indices, infer_type(rois).checked_type.dtype)
+        batch_indices = _op.cast(batch_indices, _infer_dtype(rois))
         rois = _op.concatenate([batch_indices, rois], 1)
 
         return _vision.roi_align(
@@ -2940,21 +3134,18 @@ class Clip(OnnxOpConverter):
 
     @classmethod
     def _impl_v11(cls, inputs, attr, params):
-        if len(inputs) == 3 and isinstance(inputs[2], _expr.Constant):
-            attr["max"] = inputs[2].data.numpy().item()
-            inputs = inputs[0:2]
-        if len(inputs) >= 2 and isinstance(inputs[1], _expr.Constant):
-            attr["min"] = inputs[1].data.numpy().item()
-            inputs = inputs[0:1]
-        if "min" in attr and "max" in attr:
-            return Clip.convert_attributes(inputs, attr, params)
-
         assert len(inputs) <= 3, "Clip-11 takes up to 3 inputs, input, min, max"
+        bounds = [inputs[i] if i < len(inputs) else None for i in (1, 2)]
+        if all(isinstance(bound, _expr.Constant) for bound in bounds):
+            # Both bounds are scalar constants, so fold them into the clip attributes.
+            attr["min"] = _constant_scalar(bounds[0])
+            attr["max"] = _constant_scalar(bounds[1])
+            return Clip.convert_attributes(inputs[0:1], attr, params)
+
         result = inputs[0]
-        for i, op in enumerate([_op.tensor.maximum, _op.tensor.minimum]):
-            if i < len(inputs) - 1:
-                if inputs[i + 1] is not None:
-                    result = op(result, inputs[i + 1])
+        for bound, op in zip(bounds, [_op.tensor.maximum, _op.tensor.minimum]):
+            if bound is not None:
+                result = op(result, bound)
         return result
 
 
@@ -2964,9 +3155,10 @@ class Softplus(OnnxOpConverter):
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
         data = inputs[0]
-        data_dtype = infer_type(data).checked_type.dtype
-        data = _op.exp(data) + _expr.const(1, dtype=data_dtype)
-        return _op.log(data)
+        data_dtype = _infer_dtype(data)
+        # Use max(x, 0) + log(1 + exp(-|x|)), which cannot overflow for large inputs.
+        log_term = _op.log(_op.exp(-_op.abs(data)) + _cached_const(1, data_dtype))
+        return _op.nn.relu(data) + log_term
 
 
 class Loop(OnnxOpConverter):
@@ -2978,10 +3170,8 @@ class Loop(OnnxOpConverter):
         cond = inputs[1]
         loop_deps = inputs[2:]
         num_deps = len(loop_deps)
-        # Create a copy of the body function to prevent the original
-        # from being modified.
-        body = copy.copy(attr["body"])
-        iter_dtype = infer_type(max_loop_count).checked_type.dtype
+        body = attr["body"]
+        iter_dtype = _infer_dtype(max_loop_count)
 
         # Determine what condition mode we're in.
         assert cond is not None or max_loop_count is not None
@@ -3008,15 +3198,14 @@ class Loop(OnnxOpConverter):
 
         # Get the current graph proto and create a clone for the subgraph
         graph_scope = GraphProto.current
+        # Nodes from the outer graph are visible in the subgraph through its parent.
         subgraph_scope = GraphProto(
-            graph_scope._shape, graph_scope._dtype, graph_scope._freeze_params
+            graph_scope._shape, graph_scope._dtype, graph_scope._freeze_params, graph_scope
         )
-        # Load nodes from outer graph into inner graph.
-        subgraph_scope._nodes = graph_scope._nodes.copy()
 
         # Create a list of variables for each value updated in the loop.
         def get_var(name, val, scan=False):
-            checked_type = infer_type(val)
+            checked_type = _cached_infer_type(val)
             if hasattr(checked_type, "type_annotation"):
                 checked_type = checked_type.type_annotation
             if hasattr(checked_type, "checked_type"):
@@ -3043,21 +3232,28 @@ class Loop(OnnxOpConverter):
 
         num_scan_outputs = len(body.output) - (1 + num_deps)
 
+        # Convert the body subgraph once, with the loop variables as its inputs. The
+        # while loop body rebinds them to its own fresh variables instead of converting
+        # the subgraph again. The body's graph inputs are all loop variables, so they
+        # are skipped rather than treated as actual inputs.
+        for name, var in zip(loop_var_names, loop_vars):
+            subgraph_scope._nodes[name] = var
+        with subgraph_scope:
+            body_outputs = subgraph_scope.from_onnx(
+                body, graph_scope.opset, get_output_expr=True, skip_inputs=len(body.input)
+            )
+
         # Construct variables and initial empty tensors for any scan outputs.
-        # To do this, we'll figure out the output shapes of the body subgraph by importing
-        # it and doing type inference.
+        # To do this, we'll figure out the output shapes of the body subgraph by
+        # doing type inference on the converted outputs.
         scan_output_vars = []
         scan_output_init = []
         if num_scan_outputs > 0:
-            with subgraph_scope:
-                loop_outputs = subgraph_scope.from_onnx(
-                    body, graph_scope.opset, get_output_expr=True
-                )
-            loop_outputs = _expr.TupleWrapper(loop_outputs, len(body.output))
+            loop_outputs = _expr.TupleWrapper(body_outputs, len(body.output))
 
         for i in range(num_scan_outputs):
             name, _, _, _ = get_info(body.output[i + 1 + num_deps])
-            output_node = infer_type(loop_outputs[i + 1 + num_deps])
+            output_node = _cached_infer_type(loop_outputs[i + 1 + num_deps])
             shape = get_const_tuple(output_node.checked_type.shape)
             dtype = output_node.checked_type.dtype
             scan_output_vars.append(
@@ -3067,14 +3263,8 @@ class Loop(OnnxOpConverter):
                 _op.reshape(_expr.const(np.array([]).astype(dtype)), [0] + [1] * len(shape))
             )
 
-        # Now we can remove loop iter variables from our inner loop's inputs.
-        # This is kind of a hack since we have graph inputs that we don't
-        # want to treat as actual inputs.
-        while len(body.input) != 0:
-            body.input.pop(0)
-
         # Define the loop body, in this function we need to unpack loop inputs,
-        # convert the loop subgraph, and pack outputs for the next iteration.
+        # bind them into the converted subgraph, and pack outputs for the next iteration.
         def body_fn(*loop_inputs):
             # Unpack inputs
             loop_count = loop_inputs[0]
@@ -3083,16 +3273,10 @@ class Loop(OnnxOpConverter):
             current_vars = list(loop_inputs[3 : (3 + num_deps)])
             scan_outputs = loop_inputs[(3 + num_deps) :]
 
-            # Prepare body inputs by adding them to node dictionary.
             new_inputs = [loop_count, max_count, cond] + current_vars
-            for i, inp in enumerate(new_inputs):
-                subgraph_scope._nodes[loop_var_names[i]] = inp
 
             # Get the output of the current loop using the updated inputs.
-            with subgraph_scope:
-                loop_outputs = subgraph_scope.from_onnx(
-                    body, graph_scope.opset, get_output_expr=True
-                )
+            loop_outputs = _expr.bind(body_outputs, dict(zip(loop_vars, new_inputs)))
             # Unpack the body outputs and prepare variables for next iteration.
             new_cond = loop_outputs[0]
             new_loop_vars = [loop_outputs[i] for i in range(1, 1 + num_deps)]
@@ -3101,7 +3285,7 @@ class Loop(OnnxOpConverter):
             # Add new scan outputs to tracking
             combined_scan_outputs = []
             for i, scan in enumerate(scan_outputs):
-                rank = len(infer_shape(scan)) - 1
+                rank = len(_cached_infer_shape(scan)) - 1
                 new_scan = new_scan_outputs[i]
                 expand_scan = _op.expand_dims(new_scan, axis=0)
                 # For non scalar outputs we need to broadcast the initial value.
@@ -3147,7 +3331,10 @@ class Loop(OnnxOpConverter):
         # Update outer graph with constants found in the subgraph.
         free_vars = analysis.free_vars(loop)
         graph_scope._params.update(subgraph_scope._params)
-        graph_scope._nodes.update(subgraph_scope._nodes)
+        # The loop variables only exist inside the body, so they are not merged.
+        for name in loop_var_names:
+            subgraph_scope._nodes.maps[0].pop(name, None)
+        graph_scope._nodes.update(subgraph_scope._nodes.maps[0])
         for var in free_vars:
             graph_scope._nodes.update({var.name_hint: var})
         return outputs
@@ -3160,7 +3347,7 @@ class If(OnnxOpConverter):
     def _impl_v1(cls, inputs, attr, params):
         cond = inputs[0]
         # Convert array to bool if needed.
-        if len(infer_shape(cond)) > 0:
+        if len(_cached_infer_shape(cond)) > 0:
             cond = _op.take(cond, _expr.const(0, dtype="int64"))
         then_branch = attr.get("then_branch", None)
         else_branch = attr.get("else_branch", None)
@@ -3168,10 +3355,12 @@ class If(OnnxOpConverter):
 
         # Create graph converters for both branches.
         graph_scope = GraphProto.current
-        then_graph = GraphProto(graph_scope._shape, graph_scope._dtype, graph_scope._freeze_params)
-        then_graph._nodes = graph_scope._nodes.copy()
-        else_graph = GraphProto(graph_scope._shape, graph_scope._dtype, graph_scope._freeze_params)
-        else_graph._nodes = graph_scope._nodes.copy()
+        then_graph = GraphProto(
+            graph_scope._shape, graph_scope._dtype, graph_scope._freeze_params, graph_scope
+        )
+        else_graph = GraphProto(
+            graph_scope._shape, graph_scope._dtype, graph_scope._freeze_params, graph_scope
+        )
 
         # Convert each branch to a relay expression.
         with then_graph:
@@ -3181,12 +3370,12 @@ class If(OnnxOpConverter):
 
         # Add constants from both branches to parent graph.
         graph_scope._params.update(then_graph._params)
-        graph_scope._nodes.update(then_graph._nodes)
+        graph_scope._nodes.update(then_graph._nodes.maps[0])
         then_free_vars = analysis.free_vars(then_expr)
         for var in then_free_vars:
             graph_scope._nodes.update({var.name_hint: var})
         graph_scope._params.update(else_graph._params)
-        graph_scope._nodes.update(else_graph._nodes)
+        graph_scope._nodes.update(else_graph._nodes.maps[0])
         else_free_vars = analysis.free_vars(else_expr)
         for var in else_free_vars:
             graph_scope._nodes.update({var.name_hint: var})
@@ -3210,17 +3399,14 @@ class NonMaxSuppression(OnnxOpConverter):
         iou_threshold = inputs[3]
         score_threshold = inputs[4]
 
-        boxes_dtype = infer_type(boxes).checked_type.dtype
+        boxes_dtype = _infer_dtype(boxes)
 
         if attr.get("center_point_box", 0) != 0:
-            xc, yc, w, h = _op.split(boxes, 4, axis=2)
-            half_w = w / _expr.const(2.0, boxes_dtype)
-            half_h = h / _expr.const(2.0, boxes_dtype)
-            x1 = xc - half_w
-            x2 = xc + half_w
-            y1 = yc - half_h
-            y2 = yc + half_h
-            boxes = _op.concatenate([y1, x1, y2, x2], axis=2)
+            # Map (xc, yc, w, h) to (y1, x1, y2, x2) as centers + signed half extents,
+            # gathering the coordinates in output order so no split/concatenate is needed.
+            centers = _op.take(boxes, _int64_const((1, 0, 1, 0)), axis=2)
+            extents = _op.take(boxes, _int64_const((3, 2, 3, 2)), axis=2)
+            boxes = centers + extents * _cached_const((-0.5, -0.5, 0.5, 0.5), boxes_dtype)
 
         if iou_threshold is None:
             iou_threshold = _expr.const(0.0, dtype="float32")
@@ -3228,7 +3414,7 @@ class NonMaxSuppression(OnnxOpConverter):
             score_threshold = _expr.const(0.0, dtype="float32")
 
         def conditionally_squeeze_scalar(x):
-            rank = len(infer_shape(x))
+            rank = len(_cached_infer_shape(x))
             assert rank <= 1, "nms thresholds must be scalars"
             if rank == 1:
                 return _op.squeeze(x, [0])
@@ -3276,28 +3462,13 @@ class ATen(OnnxOpConverter):
     @classmethod
     def _check_index(cls, indices, values):
         def unfolding_indices(indices, values):
-            n = len(indices)
-            flatten_indices = []
-            slices_size = []
-            for index in indices:
-                flatten_indices.append(_op.reshape(index, _op.const([-1])))
-                slices_size.append(infer_shape(flatten_indices[-1])[0])
-            repeat_size = [1]
-            tile_size = [1]
-            for i in range(1, n):
-                repeat_size.append(slices_size[-i] * repeat_size[-1])
-                tile_size.append(slices_size[i - 1] * tile_size[-1])
-            repeat_size.reverse()
-            unflod_slices = []
-            for i in range(n):
-                unflod_slices.append(
-                    fold_constant(
-                        _op.repeat(_op.tile(flatten_indices[i], (tile_size[i],)), repeat_size[i], 0)
-                    )
-                )
+            flatten_indices = [_op.reshape(index, _op.const([-1])) for index in indices]
+            # The cartesian product of the indices, with the first index varying slowest.
+            grids = _op.meshgrid(flatten_indices, indexing="ij")
+            unflod_slices = [_op.reshape(grids[i], _op.const([-1])) for i in range(len(indices))]
             return unflod_slices, _op.reshape(values, _op.const([-1]))
 
-        values_shape = infer_shape(values)
+        values_shape = _cached_infer_shape(values)
         if len(values_shape) != 1:
             return unfolding_indices(indices, values)
         return indices, values
@@ -3325,14 +3496,18 @@ class ATen(OnnxOpConverter):
         mode = attr.get("mode", 1)
         reduction_fn = mode_map[mode]
         weights, indices, offsets = inputs[0], inputs[1], inputs[2]
-        offsets_shape = _op.shape_of(offsets, dtype="int64")
-        indices_shape = _op.stack(
-            [
-                _op.take(offsets_shape, _expr.const(0, dtype="int64")),
-                _expr.const(-1, dtype="int64"),
-            ],
-            axis=0,
-        )
+        num_bags = _cached_infer_shape(offsets)[0]
+        if isinstance(num_bags, int):
+            indices_shape = (num_bags, -1)
+        else:
+            offsets_shape = _op.shape_of(offsets, dtype="int64")
+            indices_shape = _op.stack(
+                [
+                    _op.take(offsets_shape, _expr.const(0, dtype="int64")),
+                    _expr.const(-1, dtype="int64"),
+                ],
+                axis=0,
+            )
         indices = _op.reshape(indices, indices_shape)
         embedding = _op.take(weights, indices.astype("int64"), axis=0)
         rembedding = reduction_fn(embedding, axis=1)
@@ -3345,28 +3520,42 @@ class ATen(OnnxOpConverter):
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        operator = attr.get("operator", None).decode("utf-8")
+        operator = attr.get("operator", None)
         assert operator, "ATen Operator not found"
         return cls._op_dispatch(operator, inputs, attr, params)
 
 
+def _zero_point_int32(zp):
+    """Get the zero point zp as the int32 expression qnn expects.
+
+    An int32 zp is used as is, and scalar or per channel constants are converted in
+    numpy into a constant shared between nodes. Anything else gets a cast.
+    """
+    if _infer_dtype(zp) == "int32":
+        return zp
+    if isinstance(zp, _expr.Constant) and len(zp.data.shape) <= 1:
+        value = zp.data.numpy().astype("int32")
+        return _cached_const(value.item() if value.ndim == 0 else tuple(value.tolist()), "int32")
+    return _op.cast(zp, "int32")
+
+
 class QuantizeLinear(OnnxOpConverter):
     """Operator converter for QuantizeLinear."""
 
     @classmethod
     def _impl_v10(cls, inputs, attr, params):
         data, scale, zp = inputs
-        out_dtype = infer_type(zp).checked_type.dtype
-        return _qnn.op.quantize(data, scale, _op.cast(zp, "int32"), 0, out_dtype)
+        out_dtype = _infer_dtype(zp)
+        return _qnn.op.quantize(data, scale, _zero_point_int32(zp), 0, out_dtype)
 
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         data, scale, zp = inputs
-        out_dtype = infer_type(zp).checked_type.dtype
+        out_dtype = _infer_dtype(zp)
         axis = attr.get("axis", 1)
-        if len(infer_shape(data)) < 2:
+        if len(_cached_infer_shape(data)) < 2:
             axis = 0
-        return _qnn.op.quantize(data, scale, _op.cast(zp, "int32"), axis, out_dtype)
+        return _qnn.op.quantize(data, scale, _zero_point_int32(zp), axis, out_dtype)
 
 
 class DequantizeLinear(OnnxOpConverter):
@@ -3375,15 +3564,15 @@ class DequantizeLinear(OnnxOpConverter):
     @classmethod
     def _impl_v10(cls, inputs, attr, params):
         data, scale, zp = inputs
-        return _qnn.op.dequantize(data, scale, _op.cast(zp, "int32"), 0)
+        return _qnn.op.dequantize(data, scale, _zero_point_int32(zp), 0)
 
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         data, scale, zp = inputs
         axis = attr.get("axis", 1)
-        if len(infer_shape(data)) <= 1:
+        if len(_cached_infer_shape(data)) <= 1:
             axis = 0
-        return _qnn.op.dequantize(data, scale, _op.cast(zp, "int32"), axis)
+        return _qnn.op.dequantize(data, scale, _zero_point_int32(zp), axis)
 
 
 class DynamicQuantizeLinear(OnnxOpConverter):
@@ -3393,12 +3582,13 @@ class DynamicQuantizeLinear(OnnxOpConverter):
     def _impl_v11(cls, inputs, attr, params):
         """This op is deprecated an only supports uint8"""
         data = inputs[0]
-        data_dtype = infer_type(data).checked_type.dtype
+        data_dtype = _infer_dtype(data)
         zero = _op.const(0, dtype=data_dtype)
+        data_min = _op.min(data)
         maximum = _op.maximum(zero, _op.max(data))
-        minimum = _op.minimum(zero, _op.min(data))
+        minimum = _op.minimum(zero, data_min)
         scale = (maximum - minimum) / _op.const(255, dtype=data_dtype)
-        zp = zero - _op.min(data) / scale
+        zp = zero - data_min / scale
         zp = _op.cast(_op.round(_op.clip(zp, 0, 255)), "uint8")
         return _expr.TupleWrapper(
             _expr.Tuple(
@@ -3422,24 +3612,22 @@ class QLinearConv(OnnxOpConverter):
         y_scale = fold_constant(get_scalar(inputs[6], params))
         y_zero_point = get_scalar(inputs[7], params, "int32")
 
-        input_shape = infer_shape(data)
+        input_shape = _cached_infer_shape(data)
 
         ndim = len(input_shape)
-        kernel_type = infer_type(weight)
-        kernel_shapes = [get_const_tuple(kernel_type.checked_type.shape)]
+        kernel_shapes = [_cached_infer_shape(weight)]
         if "kernel_shape" not in attr:
             attr["kernel_shape"] = kernel_shapes[0][2:]
 
         if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
             if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
                 # Warning: Convolution does not yet support dynamic shapes,
                 # one will need to run dynamic_to_static on this model after import
                 data = autopad(
                     data,
-                    attr.get("strides", [1] * (ndim - 2)),
+                    attr.get("strides", _ones(ndim - 2)),
                     attr["kernel_shape"],
-                    attr.get("dilations", [1] * (ndim - 2)),
+                    attr.get("dilations", _ones(ndim - 2)),
                     ndim,
                     pad_value=x_zero_point.data,
                     mode=attr["auto_pad"],
@@ -3454,8 +3642,8 @@ class QLinearConv(OnnxOpConverter):
             attr.pop("auto_pad")
 
         out_channels = kernel_shapes[0][0]
-        dilation = attr.get("dilations", [1] * (ndim - 2))
-        strides = attr.get("strides", [1] * (ndim - 2))
+        dilation = attr.get("dilations", _ones(ndim - 2))
+        strides = attr.get("strides", _ones(ndim - 2))
         padding = attr["pads"] if "pads" in attr else 0
         groups = attr["group"] if "group" in attr else 1
 
@@ -3482,7 +3670,7 @@ class QLinearConv(OnnxOpConverter):
         if use_bias:
             out = _op.nn.bias_add(out, inputs[8])
 
-        out_dtype = infer_type(inputs[7]).checked_type.dtype
+        out_dtype = _infer_dtype(inputs[7])
         requantize_scale = _op.multiply(x_scale, w_scale)
 
         # requantize requires y_scale to be constant,
@@ -3517,7 +3705,20 @@ class QLinearAdd(OnnxOpConverter):
         c_scale = get_scalar(inputs[6], params)
         c_zero_point = get_scalar(inputs[7], params, "int32")
 
-        dtype = infer_type(a).checked_type.dtype
+        # With one shared scale the sum is exact in integers, so qnn.add matches onnxruntime
+        qparams = [
+            fold_constant(p)
+            for p in (a_scale, a_zero_point, b_scale, b_zero_point, c_scale, c_zero_point)
+        ]
+        if all(isinstance(p, _expr.Constant) for p in qparams):
+            a_scale, a_zero_point, b_scale, b_zero_point, c_scale, c_zero_point = qparams
+            scales = {p.data.numpy().item() for p in (a_scale, b_scale, c_scale)}
+            if len(scales) == 1:
+                return _qnn.op.add(
+                    a, b, a_scale, a_zero_point, b_scale, b_zero_point, c_scale, c_zero_point
+                )
+
+        dtype = _infer_dtype(a)
 
         ## Onnxruntime doesn't actually do this op in integer, they dequantize to fp32
         ## and then requantize afer
@@ -3559,7 +3760,7 @@ class QLinearMatMul(OnnxOpConverter):
             x2 = try_resolve_var_to_const(x, params)
             x3 = ensure_scalar_shape(x2)
 
-            x_dtype = infer_type(x).checked_type.dtype
+            x_dtype = _infer_dtype(x)
             if (dtype_override is not None) and (dtype_override != x_dtype):
                 x4 = _op.cast(x3, dtype_override)
             else:
@@ -3571,19 +3772,19 @@ class QLinearMatMul(OnnxOpConverter):
         # Unpack the inputs and obtain some type info...
         a, a_scale, a_zp, b, b_scale, b_zp, y_scale, y_zp = inputs
 
-        a_type = infer_type(a).checked_type  # 'T1' in ONNX doc for this op
-        a_scale_type = infer_type(a_scale).checked_type
-        a_zp_type = infer_type(a_zp).checked_type
+        a_type = _cached_infer_type(a).checked_type  # 'T1' in ONNX doc for this op
+        a_scale_type = _cached_infer_type(a_scale).checked_type
+        a_zp_type = _cached_infer_type(a_zp).checked_type
 
-        b_type = infer_type(b).checked_type  # 'T2' in ONNX doc for this op
-        b_scale_type = infer_type(b_scale).checked_type
-        b_zp_type = infer_type(b_zp).checked_type
+        b_type = _cached_infer_type(b).checked_type  # 'T2' in ONNX doc for this op
+        b_scale_type = _cached_infer_type(b_scale).checked_type
+        b_zp_type = _cached_infer_type(b_zp).checked_type
 
-        y_scale_type = infer_type(y_scale).checked_type
-        y_zp_type = infer_type(y_zp).checked_type  # 'T3' in ONNX doc for this op
+        y_scale_type = _cached_infer_type(y_scale).checked_type
+        y_zp_type = _cached_infer_type(y_zp).checked_type  # 'T3' in ONNX doc for this op
 
-        a_shape = infer_shape(a)
-        b_shape = infer_shape(b)
+        a_shape = get_const_tuple(a_type.shape)
+        b_shape = get_const_tuple(b_type.shape)
 
         # Verify type assumptions, based on the ONNX doc for this op...
         assert a_type.dtype in ["int8", "uint8"]
@@ -3617,7 +3818,7 @@ class QLinearMatMul(OnnxOpConverter):
 
         # TODO: Confirm that we're using 'num_hidden_units' correctly / as intended with
         # the '_qnn.op.dense' instance below.
-        num_hidden_units = infer_shape(b)[-1]
+        num_hidden_units = b_shape[-1]
 
         # - Specify the matmul result dtype as int32, so that hopefully the matmul will use
         #   a 32-bit accumulator as seems to be required by the ONNX op's documentation.
@@ -3707,6 +3908,31 @@ class QLinearMul(OnnxOpConverter):
         return _qnn.op.quantize(out, y_scale, y_zero_point, out_dtype=dtype)
 
 
+def _qlinear_lookup(fn, x, x_scale, x_zero_point, y_scale, y_zero_point, dtype):
+    """Apply the float function fn to a quantized 8 bit tensor through a lookup table.
+
+    When all quantization parameters are constant, dequantize -> fn -> quantize is evaluated
+    in numpy for each of the 256 possible inputs, and the op becomes a single take.
+    Returns None when the parameters are not constant or dtype is not an 8 bit integer.
+    """
+    if dtype not in ("int8", "uint8"):
+        return None
+    qparams = [fold_constant(p) for p in (x_scale, x_zero_point, y_scale, y_zero_point)]
+    if not all(isinstance(p, _expr.Constant) for p in qparams):
+        return None
+    x_scale, x_zero_point, y_scale, y_zero_point = [p.data.numpy() for p in qparams]
+    info = np.iinfo(dtype)
+    values = np.arange(info.min, info.max + 1, dtype="int32")
+    real = (values - x_zero_point).astype("float32") * x_scale.astype("float32")
+    scaled = fn(real).astype("float32") / y_scale.astype("float32") + np.float32(y_zero_point)
+    # Round half away from zero like qnn.quantize, not half to even like np.round.
+    scaled = scaled.astype("float64")
+    table = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)
+    table = np.clip(table, info.min, info.max).astype(dtype)
+    index = _op.cast(x, "int32") - _cached_const(info.min, "int32")
+    return _op.take(_expr.const(table), index)
+
+
 class QLinearLeakyRelu(OnnxOpConverter):
     """Operator converter for QLinearLeakyRelu from Microsoft onnxruntime contrib opset."""
 
@@ -3721,6 +3947,18 @@ class QLinearLeakyRelu(OnnxOpConverter):
 
         dtype = infer_type(inputs[0]).checked_type.dtype
 
+        out = _qlinear_lookup(
+            lambda v: np.where(v >= 0, v, v * np.float32(alpha)),
+            inputs[0],
+            a_scale,
+            a_zero_point,
+            y_scale,
+            y_zero_point,
+            dtype,
+        )
+        if out is not None:
+            return out
+
         # Onnxruntime doesn't actually do this op in integer, they dequantize to fp32
         # and then requantize afer (according to documentation below)
         # https://github.com/microsoft/onnxruntime/blob/master/docs/ContribOperators.md#com.microsoft.QLinearLeakyRelu
@@ -3742,6 +3980,12 @@ class QLinearSigmoid(OnnxOpConverter):
 
         dtype = infer_type(x).checked_type.dtype
 
+        out = _qlinear_lookup(
+            lambda v: 1 / (1 + np.exp(-v)), x, x_scale, x_zero_point, y_scale, y_zero_point, dtype
+        )
+        if out is not None:
+            return out
+
         ## Apparently, onnxruntime doesn't do this op in integer, they dequantize to fp32
         ## and then requantize after:
         ## https://github.com/microsoft/onnxruntime/blob/master/onnxruntime/core/
@@ -3766,13 +4010,9 @@ class QLinearConcat(OnnxOpConverter):
         assert (
             len(inputs) % 3 == 2
         ), "Additional input count must be a multiple of 3 -- tensor/scale/zero_point tuples"
-        tensors = []
-        scales = []
-        zero_points = []
-        for i in range(2, len(inputs), 3):
-            tensors.append(inputs[i])
-            scales.append(get_scalar(inputs[i + 1], params))
-            zero_points.append(get_scalar(inputs[i + 2], params, "int32"))
+        tensors = inputs[2::3]
+        scales = [get_scalar(scale, params) for scale in inputs[3::3]]
+        zero_points = [get_scalar(zp, params, "int32") for zp in inputs[4::3]]
 
         return _qnn.op.concatenate(tensors, scales, zero_points, y_scale, y_zero_point, axis)
 
@@ -3791,25 +4031,22 @@ class ConvInteger(OnnxOpConverter):
         if weight_zp is None:
             weight_zp = _expr.const(0, "int32")
 
-        input_type = infer_type(data)
-        input_shape = get_const_tuple(input_type.checked_type.shape)
+        input_shape = _cached_infer_shape(data)
 
         ndim = len(input_shape)
-        kernel_type = infer_type(weight)
-        kernel_shape = get_const_tuple(kernel_type.checked_type.shape)
+        kernel_shape = _cached_infer_shape(weight)
         if "kernel_shape" not in attr:
             attr["kernel_shape"] = kernel_shape[2:]
 
         if "auto_pad" in attr:
-            attr["auto_pad"] = attr["auto_pad"].decode("utf-8")
             if attr["auto_pad"] in ("SAME_UPPER", "SAME_LOWER"):
                 # Warning: Convolution does not yet support dynamic shapes,
                 # one will need to run dynamic_to_static on this model after import
                 data = autopad(
                     data,
-                    attr.get("strides", [1] * (ndim - 2)),
+                    attr.get("strides", _ones(ndim - 2)),
                     attr["kernel_shape"],
-                    attr.get("dilations", [1] * (ndim - 2)),
+                    attr.get("dilations", _ones(ndim - 2)),
                     ndim,
                     pad_value=data_zp,
                     mode=attr["auto_pad"],
@@ -3824,8 +4061,8 @@ class ConvInteger(OnnxOpConverter):
             attr.pop("auto_pad")
 
         out_channels = kernel_shape[0]
-        dilation = attr.get("dilations", [1] * (ndim - 2))
-        strides = attr.get("strides", [1] * (ndim - 2))
+        dilation = attr.get("dilations", _ones(ndim - 2))
+        strides = attr.get("strides", _ones(ndim - 2))
         padding = attr["pads"] if "pads" in attr else 0
         groups = attr["group"] if "group" in attr else 1
 
@@ -3858,11 +4095,19 @@ class BitShift(OnnxOpConverter):
         if len(inputs) != 2:
             raise ValueError("Bitshift expects 2 inputs")
 
-        direction = attr.get("direction", "LEFT").decode("ascii")
+        x, shift = inputs
+        shift = try_resolve_var_to_const(shift, params)
+        if isinstance(shift, _expr.Constant):
+            amount = shift.data.numpy()
+            # A single shift amount that adds no dimensions becomes a scalar immediate
+            if amount.size == 1 and amount.ndim <= len(_cached_infer_shape(x)):
+                shift = _expr.const(amount.reshape(()))
+
+        direction = attr.get("direction", "LEFT")
         if direction == "LEFT":
-            out = _op.left_shift(*inputs)
+            out = _op.left_shift(x, shift)
         elif direction == "RIGHT":
-            out = _op.right_shift(*inputs)
+            out = _op.right_shift(x, shift)
         else:
             raise ValueError("Unsupported Shift Direction: " + direction)
         return out
@@ -3906,7 +4151,7 @@ class Einsum(OnnxOpConverter):
 
     @classmethod
     def _impl_v12(cls, inputs, attr, params):
-        equation = attr["equation"].decode("utf-8")
+        equation = attr["equation"]
         return _op.einsum(inputs, equation)
 
 
@@ -3933,76 +4178,48 @@ class RandomUniform(OnnxOpConverter):
         _, vals = _expr.TupleWrapper(output, 2)
         return vals
 
-class RandomNormal(OnnxOpConverter):
-    """Operator converter for random_uniform"""
+def _random_normal(shape, dtype, attr):
+    """Draw normal samples for RandomNormal and RandomNormalLike."""
+    assert dtype in [
+        "float32",
+        "float64",
+    ], "Only float random value generation is currently supported."
 
-    @classmethod
-    def _impl_v1(cls, inputs, attr, params):
-        dtype = get_type(attr.get("dtype", 1))
-        mean = attr.get("mean", 0.0)
-        scale = attr.get("scale", 1.0)
-        seed = attr.get("seed", None)
-        shape = attr["shape"]
+    seed = attr.get("seed", None)
+    if seed is None:
+        seed = np.random.randint(1e6)
 
-        assert dtype in [
-            "float32",
-            "float64",
-        ], "Only float random value generation is currently supported."
+    key = _random.threefry_key(seed)
+    mean = attr.get("mean", 0.0)
+    scale = attr.get("scale", 1.0)
+    output = _op.random.normal(key, shape, dtype=dtype, mean=mean, scale=scale)
+    _, vals = _expr.TupleWrapper(output, 2)
+    return vals
 
-        if seed is None:
-            seed = np.random.randint(1e6)
 
-        key = _random.threefry_key(seed)
-        output = _op.random.uniform(key, shape, dtype=dtype, low=0.0, high=1.0)
-        key, u1 = _expr.TupleWrapper(output, 2)
-        output2 = _op.random.uniform(key, shape, dtype=dtype, low=0.0, high=1.0)
-        _, u2 = _expr.TupleWrapper(output2, 2)
+class RandomNormal(OnnxOpConverter):
+    """Operator converter for random_normal"""
 
-        # do box-muller transform
-        const1 = _op.const(-2.0)
-        const2 = _op.const(2.0*np.pi)
-        vals = _op.sqrt(const1 * _op.log(u1)) * _op.cos(const2 * u2)
-        vals = _op.add(_op.multiply(vals, _op.const(scale)), _op.const(mean))
+    @classmethod
+    def _impl_v1(cls, inputs, attr, params):
+        dtype = get_type(attr.get("dtype", 1))
+        return _random_normal(attr["shape"], dtype, attr)
 
-        return vals
 
 class RandomNormalLike(OnnxOpConverter):
-    """Operator converter for random_uniform"""
+    """Operator converter for random_normal_like"""
 
     @classmethod
     def _impl_v1(cls, inputs, attr, params):
-        in_checked_type = infer_type(inputs[0]).checked_type
-        in_dtype = in_checked_type.dtype
-        in_shape = list(get_const_tuple(in_checked_type.shape))
+        in_shape = list(_cached_infer_shape(inputs[0]))
         dtype = attr.get("dtype", None)
         if dtype is None:
-            dtype = in_dtype
+            dtype = _infer_dtype(inputs[0])
         else:
             dtype = get_type(dtype)
-        mean = attr.get("mean", 0.0)
-        scale = attr.get("scale", 1.0)
-        seed = attr.get("seed", None)
-        assert dtype in [
-            "float32",
-            "float64",
-        ], "Only float random value generation is currently supported."
+        return _random_normal(in_shape, dtype, attr)
 
-        if seed is None:
-            seed = np.random.randint(1e6)
 
-        key = _random.threefry_key(seed)
-        output = _op.random.uniform(key, in_shape, dtype=dtype, low=0.0, high=1.0)
-        key, u1 = _expr.TupleWrapper(output, 2)
-        output2 = _op.random.uniform(key, in_shape, dtype=dtype, low=0.0, high=1.0)
-        _, u2 = _expr.TupleWrapper(output2, 2)
-
-        # do box-muller transform
-        const1 = _op.const(-2.0)
-        const2 = _op.const(2.0*np.pi)
-        vals = _op.sqrt(const1 * _op.log(u1)) * _op.cos(const2 * u2)
-        vals = _op.add(_op.multiply(vals, _op.const(scale)), _op.const(mean))
-
-        return vals
 class NegativeLogLikelihoodLoss(OnnxOpConverter):
     """Operator converter for NegativeLogLikehoodLoss"""
 
@@ -4065,7 +4282,7 @@ class NegativeLogLikelihoodLoss(OnnxOpConverter):
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         ignore_index = attr.get("ignore_index", None)
-        reduction = attr.get("reduction", b"mean").decode("utf-8")
+        reduction = attr.get("reduction", "mean")
 
         if reduction not in cls.VALID_REDUCTIONS:
             raise ValueError(
@@ -4098,7 +4315,7 @@ class SoftmaxCrossEntropyLoss(OnnxOpConverter):
     @classmethod
     def _impl_v13(cls, inputs, attr, params):
         ignore_index = attr.get("ignore_index", None)
-        reduction = attr.get("reduction", b"mean").decode("utf-8")
+        reduction = attr.get("reduction", "mean")
         input_tensor, target_tensor = inputs[0], inputs[1]
         if len(inputs) == 3:
             weight_tensor = inputs[2]
@@ -4144,6 +4361,9 @@ class Adagrad(OnnxOpConverter):
         norm_coefficient = relay.const(norm_coefficient, dtype=dtype_inputs)
         T = relay.cast_like(T, inputs[3])
 
+        # The decayed learning rate is shared by every tensor
+        r = fold_constant(R / (relay.const(1.0, dtype=dtype_inputs) + T * decay_factor))
+
         assert (
             len(inputs) - 2
         ) % 3 == 0, f"Expect triplets for remaining inputs, found {len(inputs) - 2}"
@@ -4158,7 +4378,6 @@ class Adagrad(OnnxOpConverter):
             gradient = inputs[i + 2 + num_input_tensors]
             accumulated_squared_gradient = inputs[i + 2 + 2 * num_input_tensors]
 
-            r = R / (relay.const(1.0, dtype=dtype_inputs) + T * decay_factor)
             g_regularized = norm_coefficient * x + gradient
             new_accumulated_squared_gradient = (
                 accumulated_squared_gradient + g_regularized * g_regularized
@@ -4208,6 +4427,10 @@ class Adam(OnnxOpConverter):
         one = relay.const(1, dtype=dtype_inputs)
         T = relay.cast_like(T, inputs[3])
 
+        # The bias-corrected learning rate is shared by every tensor
+        true_branch = R * relay.sqrt(one - relay.power(beta, T)) / (one - relay.power(alpha, T))
+        R_adjusted = fold_constant(relay.If(T > relay.const(0, dtype=dtype_inputs), true_branch, R))
+
         # Remaining inputs are:
         # [x_1, x_2 ..., x_1_grad, x_2_grad, ... x_1_g_accum, x_2_g_accum..., x_1_g_sq_accum, ...]
         num_input_tensors = (len(inputs) - 2) // 4
@@ -4225,9 +4448,6 @@ class Adam(OnnxOpConverter):
             h_new = beta * h + inverse_beta * g_regularized * g_regularized
             h_sqrt = relay.sqrt(h_new) + epsilon
 
-            true_branch = R * relay.sqrt(one - relay.power(beta, T)) / (one - relay.power(alpha, T))
-            R_adjusted = relay.If(T > relay.const(0, dtype=dtype_inputs), true_branch, R)
-
             x_new = x - R_adjusted * (v_new / h_sqrt)
             x_result = (one - norm_coefficient_post) * x_new
 
@@ -4249,7 +4469,7 @@ class Momentum(OnnxOpConverter):
     def _impl_v1(cls, inputs, attr, params):
         alpha = attr["alpha"]
         beta = attr["beta"]
-        mode = attr["mode"].decode("utf-8")
+        mode = attr["mode"]
         norm_coefficient = attr["norm_coefficient"]
 
         assert mode in ["nesterov", "standard"], f"Unknown momentum mode {mode}"
@@ -4304,6 +4524,9 @@ _identity_list = []
 # use AttrCvt if attributes need to be converted
 # for 1 to N mapping(composed), use custom callable functions
 # for N to 1 mapping, currently not supported(?)
+# Converters keep no per-call state (AttrCvt extends a copy of its ignores), so one map per
+# opset is shared by all callers.
+@functools.lru_cache(maxsize=None)
 def _get_convert_map(opset):
     return {
         # defs/experimental
@@ -4516,12 +4739,20 @@ class GraphProto:
         at compile time and helps in making models static if certain inputs represent
         attributes relay would traditionally consider compile-time constants.
 
+    parent : GraphProto, optional
+        The enclosing graph when converting a subgraph. Its nodes are visible to the
+        subgraph through a ChainMap, so new bindings only go into the subgraph's own
+        dict and the parent's nodes are never copied.
+
     """
 
     current = None
 
-    def __init__(self, shape, dtype, freeze_params=False):
-        self._nodes = {}
+    def __init__(self, shape, dtype, freeze_params=False, parent=None):
+        if parent is not None:
+            self._nodes = collections.ChainMap({}, parent._nodes)
+        else:
+            self._nodes = {}
         self._params = {}
         self._inputs = {}
         self._renames = {}
@@ -4532,6 +4763,14 @@ class GraphProto:
         self._dtype = dtype
         self.opset = None
         self._freeze_params = freeze_params
+        # Subgraphs share the type inference and scalar caches of their parent graph
+        # since they refer to the same outer expressions.
+        if GraphProto.current is not None:
+            self._infer_cache = GraphProto.current._infer_cache
+            self._scalar_cache = GraphProto.current._scalar_cache
+        else:
+            self._infer_cache = weakref.WeakKeyDictionary()
+            self._scalar_cache = weakref.WeakKeyDictionary()
 
     def __enter__(self):
         self._old_manager = GraphProto.current
@@ -4550,7 +4789,7 @@ class GraphProto:
         fn = _function.Function(analysis.free_vars(body), body)
         return fn, {}
 
-    def from_onnx(self, graph, opset, get_output_expr=False):
+    def from_onnx(self, graph, opset, get_output_expr=False, skip_inputs=0):
         """Construct Relay expression from ONNX graph.
 
         Onnx graph is a python protobuf object.
@@ -4572,6 +4811,11 @@ class GraphProto:
             than a packaged module. This can be useful when converting subgraphs to
             relay.
 
+        skip_inputs: int
+            The number of leading graph inputs to ignore. Subgraph converters use this
+            for inputs they have already bound in the node dictionary, so the graph
+            itself never needs to be modified.
+
         Returns
         -------
         mod : tvm.IRModule
@@ -4595,7 +4839,7 @@ class GraphProto:
                     shape=self._params[init_tensor.name].shape,
                     dtype=self._params[init_tensor.name].dtype,
                 )
-        for i in graph.input:
+        for i in graph.input[skip_inputs:]:
             # from onnx v0.2, GraphProto.input has type ValueInfoProto,
             #  and the name is 'i.name'
             i_name, i_shape, d_type, i_shape_name = get_info(i)
@@ -4749,10 +4993,16 @@ class GraphProto:
         """Convert a list of AttributeProto to a dict, with names as keys."""
         attrs = {}
         for a in attr_proto:
-            for f in ["f", "i", "s", "g"]:
+            for f in ["f", "i", "g"]:
                 if a.HasField(f):
                     attrs[a.name] = getattr(a, f)
-            for f in ["floats", "ints", "strings"]:
+            # String attributes are decoded once here so that converters can use them directly.
+            if a.HasField("s"):
+                attrs[a.name] = a.s.decode("utf-8")
+            if list(a.strings):
+                assert a.name not in attrs, "Only one type of attr is allowed"
+                attrs[a.name] = tuple(value.decode("utf-8") for value in a.strings)
+            for f in ["floats", "ints"]:
                 if list(getattr(a, f)):
                     assert a.name not in attrs, "Only one type of attr is allowed"
                     attrs[a.name] = tuple(getattr(a, f))
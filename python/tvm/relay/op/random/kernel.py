@@ -183,3 +183,51 @@ def uniform(key, shape, dtype="float32", low=0.0, high=1.0):
     if not isinstance(high, Expr):
         high = const(high, dtype=dtype)
     return _make.uniform(key, low, high, shape, dtype)
+
+
+def normal(key, shape, dtype="float32", mean=0.0, scale=1.0):
+    """Draw samples from a normal distribution.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        key = threefry_key(0)
+        key, random_values = normal(key, (100,), mean=0, scale=10)
+
+    Parameters
+    ----------
+    key : relay.Expr
+        key that uniquely determines the random values. Multiple uses with the
+        same generator will generate the same random values. This generator should be
+        treated as an opaque pointer. You can create one from calling
+        :py:func:`threefry_key`, :py:func:`threefry_split`, or
+        :py:func:`threefry_generate`. **Do not use this generator again after calling
+        this function.**
+
+    shape : Sequence[int]
+        Desired outputs shape of random numbers.
+
+    dtype : str
+        Desired outputs type of random numbers.
+
+    mean : float or relay.Expr, optional
+        Mean of the normal distribution.
+
+    scale : float or relay.Expr, optional
+        Standard deviation of the normal distribution.
+
+    Returns
+    -------
+    new_key : relay.Expr
+        New random key to pass to future uses of random functions.
+
+    random_values : relay.Expr
+        The generated normal distributed random numbers.
+    """
+    if not isinstance(mean, Expr):
+        mean = const(mean, dtype=dtype)
+    if not isinstance(scale, Expr):
+        scale = const(scale, dtype=dtype)
+    return _make.normal(key, mean, scale, shape, dtype)
@@ -544,3 +544,58 @@ def uniform(gen, low, high, out_shape, out_dtype):
     uniform_values = tvm.topi.add(tvm.topi.multiply(standard_uniform_values, high - low), low)
 
     return new_gen, uniform_values
+
+
+def normal(gen, mean, scale, out_shape, out_dtype):
+    """Draw samples from a normal distribution.
+
+    The values are produced from two sets of uniform samples with the Box-Muller transform,
+    so only a single call to the random number generator is needed.
+
+    Parameters
+    ----------
+    gen : ThreefryKey
+        Generator state. Can be create with :py:func:`tvm.relay.threefry_key`. This should not be
+        reused in another function, otherwise random numbers will be repeated.
+
+    mean : Tensor[(), out_dtype]
+        The mean of the normal distribution.
+
+    scale : Tensor[(), out_dtype]
+        The standard deviation of the normal distribution.
+
+    out_shape : Sequence[int]
+        Output shape of the random numbers.
+
+    out_dtype : str
+        The output dtype.
+
+    Returns
+    -------
+    new_gen : ThreefryKey
+        New generator state that is distinct from `gen`.
+
+    out : Tensor[out_shape, out_dtype]
+        Tensor of random numbers with shape `out_shape` and type `out_dtype`.
+    """
+    out_shape = list(out_shape)
+    # Box-Muller needs two uniform samples per output, draw both sets at once
+    new_gen, uniform_values = uniform(
+        gen,
+        tvm.tir.const(0.0, out_dtype),
+        tvm.tir.const(1.0, out_dtype),
+        [2] + out_shape,
+        out_dtype,
+    )
+    # uniform samples lie in [0, 1), so 1 - u keeps the log finite
+    u1 = tvm.te.compute(
+        out_shape, lambda *i: tvm.tir.const(1.0, out_dtype) - uniform_values[(0,) + i]
+    )
+    u2 = tvm.te.compute(out_shape, lambda *i: uniform_values[(1,) + i])
+    radius = tvm.topi.sqrt(tvm.topi.multiply(tvm.topi.log(u1), tvm.tir.const(-2.0, out_dtype)))
+    angle = tvm.topi.multiply(u2, tvm.tir.const(2.0 * np.pi, out_dtype))
+    normal_values = tvm.topi.add(
+        tvm.topi.multiply(tvm.topi.multiply(radius, tvm.topi.cos(angle)), scale), mean
+    )
+
+    return new_gen, normal_values
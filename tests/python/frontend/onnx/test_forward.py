@@ -352,9 +352,13 @@ def test_double_reshape(target, dev):
 
 @tvm.testing.parametrize_targets
 def test_expand(target, dev):
-    def _test_expand(name, data, shape, ref_data, dtype="int32"):
+    def _test_expand(
+        name, data, shape, ref_data, dtype="int32", shape_as_input=False, dynamic_data=False
+    ):
         shape_array = np.array(shape)
-        if dtype == "int32":
+        if shape_as_input:
+            shape_node = None
+        elif dtype == "int32":
             shape_node = onnx.helper.make_node(
                 "Constant",
                 inputs=[],
@@ -382,16 +386,37 @@ def test_expand(target, dev):
             raise "Invalid dtype"
         expand_node = helper.make_node("Expand", ["in", "shape"], ["out"])
 
+        nodes = [expand_node]
+        inputs = [helper.make_tensor_value_info("in", TensorProto.FLOAT, list(data.shape))]
+        input_data = [data]
+        if shape_as_input:
+            # A non-constant shape takes the dynamic conversion path.
+            shape_type = TensorProto.INT32 if dtype == "int32" else TensorProto.INT64
+            inputs.append(helper.make_tensor_value_info("shape", shape_type, [len(shape)]))
+            input_data.append(shape_array.astype(dtype))
+        else:
+            nodes.insert(0, shape_node)
+
         graph = helper.make_graph(
-            [shape_node, expand_node],
+            nodes,
             "expand_test",
-            inputs=[helper.make_tensor_value_info("in", TensorProto.FLOAT, list(data.shape))],
+            inputs=inputs,
             outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, list(ref_data.shape))],
         )
 
         model = helper.make_model(graph, producer_name=name)
 
-        tvm_out = get_tvm_output_with_vm(model, data, target, dev, freeze_params=True)
+        if dynamic_data:
+            shape_dict = {"in": [relay.Any()] * data.ndim}
+            if shape_as_input:
+                shape_dict["shape"] = shape_array.shape
+            mod, params = relay.frontend.from_onnx(model, shape_dict, freeze_params=True)
+            tvm_out = relay.create_executor("vm", mod=mod, device=dev, target=target).evaluate()(
+                *input_data, **params
+            )
+            tvm_out = tvm_out.numpy()
+        else:
+            tvm_out = get_tvm_output_with_vm(model, input_data, target, dev, freeze_params=True)
         tvm.testing.assert_allclose(ref_data, tvm_out)
 
     in_shape = (3, 1)
@@ -408,6 +433,25 @@ def test_expand(target, dev):
     _test_expand("expand_with_dim_changed_test", data, shape, ref_data, "int32")
     _test_expand("expand_with_dim_changed_test", data, shape, ref_data, "int64")
 
+    # The shape has a lower rank than the data, so it is left padded with ones.
+    in_shape = (2, 3, 4)
+    shape = (3, 1)
+    data = np.random.uniform(size=in_shape).astype(np.float32)
+    ref_data = data * np.ones(shape, dtype=np.float32)
+    _test_expand("expand_with_lower_rank_shape_test", data, shape, ref_data, "int32")
+    _test_expand("expand_with_lower_rank_shape_test", data, shape, ref_data, "int64")
+
+    for dtype in ["int32", "int64"]:
+        for in_shape, shape in [((2, 3, 4), (3, 1)), ((3, 1), (2, 1, 6)), ((3, 1), (3, 4))]:
+            data = np.random.uniform(size=in_shape).astype(np.float32)
+            ref_data = data * np.ones(shape, dtype=np.float32)
+            _test_expand(
+                "expand_with_shape_input_test", data, shape, ref_data, dtype, shape_as_input=True
+            )
+            _test_expand(
+                "expand_with_dynamic_data_test", data, shape, ref_data, dtype, dynamic_data=True
+            )
+
 
 @tvm.testing.parametrize_targets
 def test_depth_to_space(target, dev):
@@ -522,6 +566,33 @@ def test_power(target, dev):
     _test_power_iteration((2, 3), (1, 3))
 
 
+@tvm.testing.parametrize_targets
+def test_power_constant_exponent(target, dev):
+    def verify_power(x, exponent, y_shape):
+        y = np.full(y_shape, exponent, dtype=x.dtype)
+        onnx_dtype = mapping.NP_TYPE_TO_TENSOR_TYPE[x.dtype]
+        node = helper.make_node("Pow", ["x", "y"], ["out"])
+        graph = helper.make_graph(
+            [node],
+            "power_constant_exponent_test",
+            inputs=[helper.make_tensor_value_info("x", onnx_dtype, list(x.shape))],
+            outputs=[helper.make_tensor_value_info("out", onnx_dtype, list(x.shape))],
+            initializer=[numpy_helper.from_array(y, "y")],
+        )
+        model = helper.make_model(graph, producer_name="power_constant_exponent_test")
+        verify_with_ort_with_inputs(
+            model, [x], target=target, dev=dev, opset=13, freeze_params=True
+        )
+
+    x = np.random.uniform(0.5, 2, size=(2, 3, 4)).astype("float32")
+    for exponent in [0, 1, 2, 3, -1, 0.5]:
+        for y_shape in [(), (1,)]:
+            verify_power(x, exponent, y_shape)
+    x_int = np.random.randint(-5, 5, size=(2, 3, 4)).astype("int64")
+    for exponent in [2, 3]:
+        verify_power(x_int, exponent, ())
+
+
 @tvm.testing.parametrize_targets
 def test_range(target, dev):
     def verify_range(start, limit, delta, dtype):
@@ -613,6 +684,47 @@ def test_unsqueeze(target, dev):
     verify_with_ort(model, [in_shape], target=target, dev=dev, opset=11)
 
 
+@tvm.testing.parametrize_targets
+def test_unsqueeze_dynamic_axes(target, dev):
+    def verify_unsqueeze(in_shape, axes):
+        out_rank = len(in_shape) + len(axes)
+        new_axes = sorted(axis % out_rank for axis in axes)
+        out_shape = list(in_shape)
+        for axis in new_axes:
+            out_shape.insert(axis, 1)
+
+        y = helper.make_node("Unsqueeze", ["in", "axes"], ["out"])
+        graph = helper.make_graph(
+            [y],
+            "unsqueeze_dynamic_axes_test",
+            inputs=[
+                helper.make_tensor_value_info("in", TensorProto.FLOAT, list(in_shape)),
+                helper.make_tensor_value_info("axes", TensorProto.INT64, [len(axes)]),
+            ],
+            outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, out_shape)],
+        )
+
+        model = helper.make_model(graph, producer_name="unsqueeze_dynamic_axes_test")
+        x = np.array(np.random.uniform(size=in_shape), dtype="float32")
+        verify_with_ort_with_inputs(
+            model,
+            [x, np.array(axes, dtype="int64")],
+            use_vm=True,
+            opset=13,
+            target=target,
+            dev=dev,
+        )
+
+    verify_unsqueeze((3, 3), [0, 3, 4])
+    verify_unsqueeze((3, 3), [4, 0])
+    # Negative axes count from the end of the output.
+    verify_unsqueeze((3, 3), [-1, 0])
+    verify_unsqueeze((2, 3), [1, -2])
+    # Scalar input.
+    verify_unsqueeze((), [0])
+    verify_unsqueeze((), [0, -1])
+
+
 @tvm.testing.parametrize_targets
 def test_gather(target, dev):
     def verify_gather(in_shape, indices, axis, dtype):
@@ -958,6 +1070,96 @@ def test_slice(target, dev):
     )
 
 
+@tvm.testing.parametrize_targets
+def test_slice_noop(target, dev):
+    def verify_slice_noop(x, starts, ends, axes, steps, is_noop):
+        initializer = [
+            numpy_helper.from_array(np.array(starts, dtype="int64"), "starts"),
+            numpy_helper.from_array(np.array(ends, dtype="int64"), "ends"),
+            numpy_helper.from_array(np.array(axes, dtype="int64"), "axes"),
+            numpy_helper.from_array(np.array(steps, dtype="int64"), "steps"),
+        ]
+        slices = [slice(None)] * x.ndim
+        for axis, start, end, step in zip(axes, starts, ends, steps):
+            slices[axis] = slice(start, end, step)
+        out_shape = list(x[tuple(slices)].shape)
+        node = helper.make_node("Slice", ["data", "starts", "ends", "axes", "steps"], ["out"])
+        graph = helper.make_graph(
+            [node],
+            "slice_noop_test",
+            inputs=[helper.make_tensor_value_info("data", TensorProto.FLOAT, list(x.shape))],
+            outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, out_shape)],
+            initializer=initializer,
+        )
+        model = helper.make_model(graph, producer_name="slice_noop_test")
+
+        mod, _ = relay.frontend.from_onnx(model, freeze_params=True)
+        assert isinstance(mod["main"].body, relay.Var) == is_noop
+        verify_with_ort_with_inputs(
+            model, [x], opset=10, freeze_params=True, use_vm=True, target=target, dev=dev
+        )
+
+    x = np.random.randn(4, 5, 6).astype(np.float32)
+    int64_max = np.iinfo(np.int64).max
+    verify_slice_noop(x, (0,), (6,), (2,), (1,), True)
+    verify_slice_noop(x, (0, 0), (4, int64_max), (0, -1), (1, 1), True)
+    verify_slice_noop(x, (0, 0, 0), (100, 100, 100), (0, 1, 2), (1, 1, 1), True)
+    verify_slice_noop(x, (0,), (5,), (2,), (1,), False)
+    verify_slice_noop(x, (1,), (6,), (2,), (1,), False)
+    verify_slice_noop(x, (0,), (6,), (2,), (2,), False)
+
+
+@tvm.testing.parametrize_targets
+def test_slice_constant_axes(target, dev):
+    def verify_slice_constant_axes(x, starts, ends, axes, steps=None):
+        starts = np.array(starts, dtype="int64")
+        ends = np.array(ends, dtype="int64")
+        slices = [slice(None)] * x.ndim
+        for i, axis in enumerate(axes):
+            step = 1 if steps is None else steps[i]
+            slices[axis] = slice(starts[i], ends[i], step)
+        out_shape = list(x[tuple(slices)].shape)
+
+        inputs = [
+            helper.make_tensor_value_info("data", TensorProto.FLOAT, list(x.shape)),
+            helper.make_tensor_value_info("starts", TensorProto.INT64, list(starts.shape)),
+            helper.make_tensor_value_info("ends", TensorProto.INT64, list(ends.shape)),
+        ]
+        initializer = [numpy_helper.from_array(np.array(axes, dtype="int64"), "axes")]
+        slice_inputs = ["data", "starts", "ends", "axes"]
+        if steps is not None:
+            initializer.append(numpy_helper.from_array(np.array(steps, dtype="int64"), "steps"))
+            slice_inputs.append("steps")
+        node = helper.make_node("Slice", slice_inputs, ["out"])
+        graph = helper.make_graph(
+            [node],
+            "slice_constant_axes_test",
+            inputs=inputs,
+            outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, out_shape)],
+            initializer=initializer,
+        )
+        model = helper.make_model(graph, producer_name="slice_constant_axes_test")
+        verify_with_ort_with_inputs(
+            model,
+            [x, starts, ends],
+            opset=11,
+            freeze_params=True,
+            use_vm=True,
+            target=target,
+            dev=dev,
+        )
+
+    x = np.random.randn(4, 5, 6).astype(np.float32)
+    # Leading axes, with and without steps.
+    verify_slice_constant_axes(x, (1,), (3,), (0,))
+    verify_slice_constant_axes(x, (1, 0), (3, 4), (0, 1), (1, 2))
+    # Non leading, unordered and negative axes go through the gather expansion.
+    verify_slice_constant_axes(x, (2,), (5,), (2,))
+    verify_slice_constant_axes(x, (1, 0), (6, 3), (2, 0))
+    verify_slice_constant_axes(x, (-4,), (-1,), (-1,))
+    verify_slice_constant_axes(x, (0, 5), (4, 0), (1, 2), (2, -1))
+
+
 def _test_onnx_op_elementwise(
     target, dev, inshape, outfunc, npargs, dtype, opname, kwargs, opset=None
 ):
@@ -979,6 +1181,28 @@ def _test_onnx_op_elementwise(
     )
 
 
+@tvm.testing.parametrize_targets
+def test_shrink(target, dev):
+    def verify_shrink(indata, kwargs):
+        node = helper.make_node("Shrink", ["in"], ["out"], **kwargs)
+        graph = helper.make_graph(
+            [node],
+            "shrink_test",
+            inputs=[helper.make_tensor_value_info("in", TensorProto.FLOAT, list(indata.shape))],
+            outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, list(indata.shape))],
+        )
+        model = helper.make_model(graph, producer_name="shrink_test")
+        verify_with_ort_with_inputs(model, [indata], [indata.shape], target=target, dev=dev)
+
+    indata = np.random.uniform(-2, 2, size=(2, 4, 5, 6)).astype("float32")
+    verify_shrink(indata, {})
+    verify_shrink(indata, {"lambd": 1.0, "bias": 0.5})
+    verify_shrink(indata, {"lambd": 0.0, "bias": 1.5})
+    # NaN is neither below -lambd nor above lambd, so it maps to zero.
+    indata = np.array([np.nan, -1.5, -0.25, 0.0, 0.25, 1.5, np.nan], dtype="float32")
+    verify_shrink(indata, {"lambd": 0.5, "bias": 0.25})
+
+
 @tvm.testing.parametrize_targets
 def test_floor(target, dev):
     _test_onnx_op_elementwise(target, dev, (2, 4, 5, 6), np.floor, {}, "float32", "Floor", {})
@@ -1048,6 +1272,44 @@ def test_clip_min_max_as_inputs(target, dev):
     verify_with_ort(model, [input_shape], out_shape=[input_shape], target=target, dev=dev)
 
 
+@tvm.testing.parametrize_targets
+def test_clip_partial_bounds_as_inputs(target, dev):
+    input_shape = (2, 4, 5, 6)
+
+    def verify_clip(input_names, constants, graph_bounds=None):
+        nodes = [
+            make_constant_node(name, onnx.TensorProto.FLOAT, (), [value])
+            for name, value in constants.items()
+        ]
+        nodes.append(helper.make_node("Clip", inputs=input_names, outputs=["out"]))
+        graph_bounds = graph_bounds if graph_bounds else {}
+        graph_inputs = [helper.make_tensor_value_info("in", TensorProto.FLOAT, list(input_shape))]
+        graph_inputs += [
+            helper.make_tensor_value_info(name, TensorProto.FLOAT, []) for name in graph_bounds
+        ]
+        graph = helper.make_graph(
+            nodes,
+            "clip_test",
+            inputs=graph_inputs,
+            outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, list(input_shape))],
+        )
+        model = helper.make_model(graph, producer_name="clip_test")
+
+        indata = np.random.randn(*input_shape).astype("float32")
+        bound_data = [np.array(value, dtype="float32") for value in graph_bounds.values()]
+        verify_with_ort_with_inputs(
+            model, [indata] + bound_data, out_shape=[input_shape], target=target, dev=dev
+        )
+
+    # Constant min, no max.
+    verify_clip(["in", "min"], {"min": -0.5})
+    # Empty min, constant max.
+    verify_clip(["in", "", "max"], {"max": 0.5})
+    # One constant bound and one bound fed as a graph input.
+    verify_clip(["in", "min", "max"], {"min": -0.5}, {"max": 0.5})
+    verify_clip(["in", "min", "max"], {"max": 0.5}, {"min": -0.5})
+
+
 @tvm.testing.parametrize_targets
 def test_round(target, dev):
     _test_onnx_op_elementwise(target, dev, (2, 4, 5, 6), np.round, {}, "float32", "Round", {})
@@ -1503,7 +1765,7 @@ def test_upsample3d_trilinear(target, dev):
 
 @tvm.testing.parametrize_targets
 def test_softmax(target, dev):
-    def verify_softmax(inshape, axis):
+    def verify_softmax(inshape, axis, opset=None):
         opname = "Softmax"
         indata = np.random.uniform(size=inshape).astype(np.float32)
         outshape = inshape
@@ -1520,10 +1782,16 @@ def test_softmax(target, dev):
         )
 
         model = helper.make_model(graph, producer_name=opname + "_test")
-        verify_with_ort_with_inputs(model, [indata], target=target, dev=dev)
+        verify_with_ort_with_inputs(model, [indata], target=target, dev=dev, opset=opset)
 
     verify_softmax((1, 10), None)
     verify_softmax((1, 10), 1)
+    # Before opset 13 the trailing axes are coerced into one.
+    verify_softmax((2, 3, 4), None, opset=11)
+    verify_softmax((2, 3, 4), 0, opset=11)
+    verify_softmax((2, 3, 4, 5), -2, opset=11)
+    verify_softmax((2, 3, 4, 5), 3, opset=11)
+    verify_softmax((2, 3, 4), 1, opset=13)
 
 
 @tvm.testing.parametrize_targets
@@ -1891,6 +2159,77 @@ def test_all_reduce_funcs(target, dev):
             )
 
 
+@tvm.testing.parametrize_targets
+def test_reduce_axes_as_input(target, dev):
+    def verify_reduce_axes_input(
+        func, opset, data, axes, keepdims, noop_with_empty_axes=0, axes_as_node=False
+    ):
+        if axes:
+            outshape = np.sum(data, axis=tuple(axes), keepdims=keepdims == 1).shape
+        elif noop_with_empty_axes:
+            outshape = data.shape
+        else:
+            outshape = np.sum(data, axis=None, keepdims=keepdims == 1).shape
+
+        axes_tensor = helper.make_tensor("axes", TensorProto.INT64, [len(axes)], axes)
+        nodes = [
+            helper.make_node(
+                func,
+                inputs=["x", "axes"],
+                outputs=["y"],
+                keepdims=keepdims,
+                noop_with_empty_axes=noop_with_empty_axes,
+            )
+        ]
+        initializer = []
+        if axes_as_node:
+            nodes.insert(0, helper.make_node("Constant", [], ["axes"], value=axes_tensor))
+        else:
+            initializer.append(axes_tensor)
+
+        graph = helper.make_graph(
+            nodes,
+            "reduce_axes_input_test",
+            inputs=[helper.make_tensor_value_info("x", TensorProto.FLOAT, list(data.shape))],
+            outputs=[helper.make_tensor_value_info("y", TensorProto.FLOAT, list(outshape))],
+            initializer=initializer,
+        )
+
+        model = helper.make_model(graph, producer_name="reduce_axes_input_test")
+
+        verify_with_ort_with_inputs(
+            model,
+            [data],
+            [outshape],
+            opset=opset,
+            target=target,
+            dev=dev,
+            rtol=1e-4,
+            atol=1e-4,
+        )
+
+    for func, opset in [("ReduceSum", 13), ("ReduceMean", 18), ("ReduceMax", 18)]:
+        for keepdims in [1, 0]:
+            for axes_as_node in [False, True]:
+                data = np.random.randn(3, 4, 5, 2).astype(np.float32)
+                verify_reduce_axes_input(
+                    func, opset, data, [1, 2], keepdims, axes_as_node=axes_as_node
+                )
+                verify_reduce_axes_input(
+                    func, opset, data, [0, -1, 2], keepdims, axes_as_node=axes_as_node
+                )
+                verify_reduce_axes_input(func, opset, data, [], keepdims, axes_as_node=axes_as_node)
+                verify_reduce_axes_input(
+                    func,
+                    opset,
+                    data,
+                    [],
+                    keepdims,
+                    noop_with_empty_axes=1,
+                    axes_as_node=axes_as_node,
+                )
+
+
 @tvm.testing.parametrize_targets
 def test_split(target, dev):
     def verify_split(indata, outdatas, split, axis=0, pass_split=True, opset=11):
@@ -2017,6 +2356,57 @@ def test_binary_ops(target, dev):
     verify_binary_ops("Equal", x, z, "bool")
 
 
+@tvm.testing.parametrize_targets
+def test_legacy_broadcast_after_conv(target, dev):
+    def verify_legacy_broadcast(op, conv_bias, post_op=None):
+        x_shape = (1, 3, 8, 8)
+        w_shape = (4, 3, 3, 3)
+        conv_inputs = ["x", "w"]
+        initializer = [
+            helper.make_tensor(
+                "w", TensorProto.FLOAT, w_shape, np.random.uniform(size=w_shape).flatten()
+            )
+        ]
+        if conv_bias:
+            conv_inputs.append("bias")
+            initializer.append(
+                helper.make_tensor("bias", TensorProto.FLOAT, [4], np.random.uniform(size=4))
+            )
+        nodes = [helper.make_node("Conv", conv_inputs, ["conv"], pads=[1, 1, 1, 1])]
+        lhs = "conv"
+        if post_op:
+            nodes.append(helper.make_node(post_op, ["conv"], ["post"]))
+            lhs = "post"
+        nodes.append(helper.make_node(op, [lhs, "y"], ["out"], broadcast=1, axis=1))
+
+        out_shape = [1, 4, 8, 8]
+        graph = helper.make_graph(
+            nodes,
+            "legacy_broadcast_test",
+            inputs=[
+                helper.make_tensor_value_info("x", TensorProto.FLOAT, list(x_shape)),
+                helper.make_tensor_value_info("y", TensorProto.FLOAT, [4]),
+            ],
+            outputs=[helper.make_tensor_value_info("out", TensorProto.FLOAT, out_shape)],
+            initializer=initializer,
+        )
+        model = helper.make_model(
+            graph,
+            producer_name="legacy_broadcast_test",
+            opset_imports=[helper.make_opsetid("", 6)],
+        )
+        x = np.random.uniform(size=x_shape).astype("float32")
+        y = np.random.uniform(size=(4,)).astype("float32")
+        verify_with_ort_with_inputs(
+            model, [x, y], [out_shape], opset=6, target=target, dev=dev, rtol=1e-4, atol=1e-4
+        )
+
+    for op in ["Add", "Mul"]:
+        verify_legacy_broadcast(op, conv_bias=False)
+        verify_legacy_broadcast(op, conv_bias=True)
+        verify_legacy_broadcast(op, conv_bias=True, post_op="Relu")
+
+
 @tvm.testing.parametrize_targets
 def test_unary_ops(target, dev):
     in_shape = (1, 2, 3, 3)
@@ -2140,6 +2530,11 @@ def test_prelu(target, dev):
     verify_prelu([2, 12, 16, 16], [1, 12, 1, 1])
     verify_prelu([2, 12, 16, 16], [1])  # Test alpha broadcasting.
     verify_prelu([3, 1], [3, 1])  # Test non NCHW workload.
+    verify_prelu([3, 4, 5, 6], [4, 1, 1])  # Test lower rank per channel slope.
+    verify_prelu([2, 4], [4])  # Test per channel slope on 2D input.
+    verify_prelu([3, 4, 5, 6], [5, 6])  # Test non channel slope broadcasting.
+    verify_prelu([3, 4, 5, 6], [1, 1, 5, 1])  # Test non channel slope of full rank.
+    verify_prelu([3, 4, 5, 6], [3, 4, 5, 6])  # Test elementwise slope.
 
 
 @tvm.testing.parametrize_targets
@@ -3805,6 +4200,54 @@ def test_lstm(target, dev):
         )
 
 
+@tvm.testing.parametrize_targets
+def test_lstm_peephole_initializer(target, dev):
+    """LSTM whose peephole weights are an initializer kept in params."""
+    seq_length, batch_size, input_size, hidden_size = 2, 1, 16, 32
+    for directions in [1, 2]:
+        x_np = np.random.uniform(size=(seq_length, batch_size, input_size)).astype("float32")
+        w_np = np.random.uniform(size=(directions, 4 * hidden_size, input_size)).astype("float32")
+        r_np = np.random.uniform(size=(directions, 4 * hidden_size, hidden_size)).astype("float32")
+        p_np = np.random.uniform(size=(directions, 3 * hidden_size)).astype("float32")
+        state_shape = (directions, batch_size, hidden_size)
+        h_np = np.random.uniform(size=state_shape).astype("float32")
+        c_np = np.random.uniform(size=state_shape).astype("float32")
+
+        node = helper.make_node(
+            "LSTM",
+            inputs=["X", "W", "R", "", "", "initial_h", "initial_c", "P"],
+            outputs=["Y", "Y_h", "Y_c"],
+            hidden_size=hidden_size,
+            direction="bidirectional" if directions == 2 else "forward",
+        )
+        graph = helper.make_graph(
+            [node],
+            "lstm_peephole_initializer_test",
+            inputs=[
+                helper.make_tensor_value_info("X", TensorProto.FLOAT, list(x_np.shape)),
+                helper.make_tensor_value_info("initial_h", TensorProto.FLOAT, list(state_shape)),
+                helper.make_tensor_value_info("initial_c", TensorProto.FLOAT, list(state_shape)),
+            ],
+            outputs=[
+                helper.make_tensor_value_info(
+                    "Y", TensorProto.FLOAT, [seq_length, directions, batch_size, hidden_size]
+                ),
+                helper.make_tensor_value_info("Y_h", TensorProto.FLOAT, list(state_shape)),
+                helper.make_tensor_value_info("Y_c", TensorProto.FLOAT, list(state_shape)),
+            ],
+            initializer=[
+                numpy_helper.from_array(w_np, "W"),
+                numpy_helper.from_array(r_np, "R"),
+                numpy_helper.from_array(p_np, "P"),
+            ],
+        )
+        model = helper.make_model(graph, producer_name="lstm_peephole_initializer_test")
+
+        verify_with_ort_with_inputs(
+            model, [x_np, h_np, c_np], target=target, dev=dev, freeze_params=False
+        )
+
+
 @tvm.testing.parametrize_targets
 def test_gru(target, dev):
     # Set seed for test reproduction
@@ -4142,27 +4585,39 @@ def test_nonzero(target, dev):
 
 @tvm.testing.parametrize_targets
 def test_topk(target, dev):
-    def verify_topk(input_dims, K, axis=-1):
+    def verify_topk(input_dims, K, axis=-1, largest=1, constant_k=False):
         output_dims = list(input_dims)
         output_dims[axis] = K
 
-        node = helper.make_node(
-            "TopK", inputs=["X", "K"], outputs=["Values", "Indicies"], axis=axis
-        )
-
-        graph = helper.make_graph(
-            [node],
-            "topk_test",
-            inputs=[
-                helper.make_tensor_value_info("X", TensorProto.FLOAT, list(input_dims)),
+        nodes = [
+            helper.make_node(
+                "TopK",
+                inputs=["X", "K"],
+                outputs=["Values", "Indicies"],
+                axis=axis,
+                largest=largest,
+            )
+        ]
+        inputs = [helper.make_tensor_value_info("X", TensorProto.FLOAT, list(input_dims))]
+        indata = [np.random.uniform(-10, 10, input_dims).astype(np.float32)]
+        if constant_k:
+            nodes.insert(0, make_constant_node("K", TensorProto.INT64, [1], [K]))
+        else:
+            inputs.append(
                 helper.make_tensor_value_info(
                     "K",
                     TensorProto.INT64,
                     [
                         1,
                     ],
-                ),
-            ],
+                )
+            )
+            indata.append(np.array([K]))
+
+        graph = helper.make_graph(
+            nodes,
+            "topk_test",
+            inputs=inputs,
             outputs=[
                 helper.make_tensor_value_info("Values", TensorProto.FLOAT, output_dims),
                 helper.make_tensor_value_info("Indicies", TensorProto.INT64, output_dims),
@@ -4171,10 +4626,7 @@ def test_topk(target, dev):
 
         model = helper.make_model(graph, producer_name="topk_test")
 
-        indata = np.random.uniform(-10, 10, input_dims).astype(np.float32)
-        verify_with_ort_with_inputs(
-            model, [indata, np.array([K])], use_vm=True, target=target, dev=dev
-        )
+        verify_with_ort_with_inputs(model, indata, use_vm=True, target=target, dev=dev)
 
     for n in [12, 32]:
         for shape in [[n], [n, n], [n, n, n]]:
@@ -4185,6 +4637,12 @@ def test_topk(target, dev):
         verify_topk([n, n, n], 5, 1)
         verify_topk([n, n, n], 5, 2)
 
+        # Smallest values, with both a dynamic and a constant k.
+        for constant_k in [False, True]:
+            verify_topk([n], 5, largest=0, constant_k=constant_k)
+            verify_topk([n, n], 10, largest=0, constant_k=constant_k)
+            verify_topk([n, n, n], 5, 1, largest=0, constant_k=constant_k)
+
 
 @tvm.testing.parametrize_targets
 def test_roi_align(target, dev):
@@ -4867,13 +5325,50 @@ def test_cumsum(target, dev):
     verify_cumsum(data, 1, 1, 1, type="int32")
 
 
+@tvm.testing.parametrize_targets
+def test_bitshift(target, dev):
+    def verify_bitshift(x, amount, direction, amount_is_input=False):
+        onnx_dtype = mapping.NP_TYPE_TO_TENSOR_TYPE[x.dtype]
+        inputs = [helper.make_tensor_value_info("x", onnx_dtype, list(x.shape))]
+        initializer = []
+        input_values = [x]
+        if amount_is_input:
+            inputs.append(helper.make_tensor_value_info("amount", onnx_dtype, list(amount.shape)))
+            input_values.append(amount)
+        else:
+            initializer.append(numpy_helper.from_array(amount, "amount"))
+        out_shape = np.broadcast(x, amount).shape
+        node = helper.make_node("BitShift", ["x", "amount"], ["y"], direction=direction)
+        graph = helper.make_graph(
+            [node],
+            "bitshift_test",
+            inputs=inputs,
+            outputs=[helper.make_tensor_value_info("y", onnx_dtype, list(out_shape))],
+            initializer=initializer,
+        )
+        model = helper.make_model(graph, producer_name="bitshift_test")
+        verify_with_ort_with_inputs(model, input_values, opset=11, target=target, dev=dev)
+
+    for dtype in ["uint8", "uint32", "uint64"]:
+        x = np.random.randint(0, 16, size=(3, 4)).astype(dtype)
+        for direction in ["LEFT", "RIGHT"]:
+            for amount_shape in [(), (1,), (1, 4), (3, 4)]:
+                amount = np.random.randint(0, 4, size=amount_shape).astype(dtype)
+                verify_bitshift(x, amount, direction)
+                verify_bitshift(x, amount, direction, amount_is_input=True)
+    # A single amount with more dimensions than the data still broadcasts it.
+    x = np.random.randint(0, 16, size=(4,)).astype("uint32")
+    verify_bitshift(x, np.array([[2]], dtype="uint32"), "LEFT")
+
+
 @tvm.testing.parametrize_targets
 def test_eyelike(target, dev):
-    def verify_eyelike(indata):
+    def verify_eyelike(indata, k=0):
         node = helper.make_node(
             "EyeLike",
             inputs=["X"],
             outputs=["Y"],
+            k=k,
         )
 
         graph = helper.make_graph(
@@ -4891,6 +5386,9 @@ def test_eyelike(target, dev):
 
     input_data = np.zeros((5, 5), dtype=np.float32)
     verify_eyelike(input_data)
+    for shape in [(5, 5), (3, 5), (5, 3)]:
+        for k in [1, -2, 4]:
+            verify_eyelike(np.zeros(shape, dtype=np.float32), k=k)
 
 
 """
@@ -5564,6 +6062,137 @@ def test_qlinearsigmoid(target, dev):
     verify_qlinearsigmoid([])
 
 
+@tvm.testing.parametrize_targets
+def test_qlinear_lookup_table(target, dev):
+    """The lookup table path must match the dequantize -> quantize fallback bit for bit."""
+
+    def get_output(op_name, dtype, qparams, const_params, kwargs):
+        onnx_dtype = mapping.NP_TYPE_TO_TENSOR_TYPE[np.dtype(dtype)]
+        x_scale, x_zero_point, y_scale, y_zero_point = qparams
+        param_values = [
+            ("x_scale", TensorProto.FLOAT, np.array(x_scale, dtype="float32")),
+            ("x_zero_point", onnx_dtype, np.array(x_zero_point, dtype=dtype)),
+            ("y_scale", TensorProto.FLOAT, np.array(y_scale, dtype="float32")),
+            ("y_zero_point", onnx_dtype, np.array(y_zero_point, dtype=dtype)),
+        ]
+        info = np.iinfo(dtype)
+        x = np.arange(info.min, info.max + 1).astype(dtype)
+
+        node = helper.make_node(
+            op_name,
+            ["x"] + [name for name, _, _ in param_values],
+            ["y"],
+            domain="com.microsoft",
+            **kwargs,
+        )
+        inputs = [helper.make_tensor_value_info("x", onnx_dtype, list(x.shape))]
+        input_data = [x]
+        initializer = []
+        for name, elem_type, value in param_values:
+            if const_params:
+                initializer.append(helper.make_tensor(name, elem_type, [], [value.item()]))
+            else:
+                inputs.append(helper.make_tensor_value_info(name, elem_type, []))
+                input_data.append(value)
+        graph = helper.make_graph(
+            [node],
+            "qlinear_lookup_test",
+            inputs=inputs,
+            outputs=[helper.make_tensor_value_info("y", onnx_dtype, list(x.shape))],
+            initializer=initializer,
+        )
+        model = helper.make_model(
+            graph,
+            producer_name="qlinear_lookup_test",
+            opset_imports=[helper.make_opsetid("", 11), helper.make_opsetid("com.microsoft", 1)],
+        )
+        return get_tvm_output_with_vm(model, input_data, target, dev, freeze_params=True)
+
+    def verify_lookup(op_name, dtype, qparams, kwargs=None):
+        kwargs = kwargs if kwargs else {}
+        lookup = get_output(op_name, dtype, qparams, True, kwargs)
+        fallback = get_output(op_name, dtype, qparams, False, kwargs)
+        tvm.testing.assert_allclose(lookup, fallback, rtol=0, atol=0)
+
+    for dtype in ["uint8", "int8"]:
+        zero_point = 128 if dtype == "uint8" else 0
+        # Unit scales with alpha=0.5 put every odd negative input on a .5 rounding boundary.
+        verify_lookup("QLinearLeakyRelu", dtype, (1.0, zero_point, 1.0, zero_point), {"alpha": 0.5})
+        verify_lookup(
+            "QLinearLeakyRelu", dtype, (0.05, zero_point, 0.025, zero_point), {"alpha": 0.1}
+        )
+        verify_lookup("QLinearSigmoid", dtype, (0.1, zero_point, 1.0 / 256, 0))
+        verify_lookup("QLinearSigmoid", dtype, (0.05, zero_point - 10, 1.0 / 128, 0))
+
+
+@tvm.testing.parametrize_targets
+def test_qlinearadd_equal_scales(target, dev):
+    """qnn.add with one shared scale must match the dequantize -> quantize fallback exactly."""
+
+    def get_model(dtype, a_shape, b_shape, qparams, const_params):
+        onnx_dtype = mapping.NP_TYPE_TO_TENSOR_TYPE[np.dtype(dtype)]
+        scale, a_zero_point, b_zero_point, c_zero_point = qparams
+        param_values = [
+            ("a_scale", TensorProto.FLOAT, np.array(scale, dtype="float32")),
+            ("a_zero_point", onnx_dtype, np.array(a_zero_point, dtype=dtype)),
+            ("b_scale", TensorProto.FLOAT, np.array(scale, dtype="float32")),
+            ("b_zero_point", onnx_dtype, np.array(b_zero_point, dtype=dtype)),
+            ("c_scale", TensorProto.FLOAT, np.array(scale, dtype="float32")),
+            ("c_zero_point", onnx_dtype, np.array(c_zero_point, dtype=dtype)),
+        ]
+        inputs = [
+            helper.make_tensor_value_info("a", onnx_dtype, list(a_shape)),
+            helper.make_tensor_value_info("b", onnx_dtype, list(b_shape)),
+        ]
+        param_data = []
+        initializer = []
+        for name, elem_type, value in param_values:
+            if const_params:
+                initializer.append(helper.make_tensor(name, elem_type, [], [value.item()]))
+            else:
+                inputs.append(helper.make_tensor_value_info(name, elem_type, []))
+                param_data.append(value)
+        input_names = ["a", "a_scale", "a_zero_point", "b", "b_scale", "b_zero_point"]
+        node = helper.make_node(
+            "QLinearAdd",
+            input_names + ["c_scale", "c_zero_point"],
+            ["c"],
+            domain="com.microsoft",
+        )
+        graph = helper.make_graph(
+            [node],
+            "qlinearadd_equal_scales_test",
+            inputs=inputs,
+            outputs=[helper.make_tensor_value_info("c", onnx_dtype, list(a_shape))],
+            initializer=initializer,
+        )
+        model = helper.make_model(
+            graph,
+            producer_name="qlinearadd_equal_scales_test",
+            opset_imports=[helper.make_opsetid("", 11), helper.make_opsetid("com.microsoft", 1)],
+        )
+        return model, param_data
+
+    def verify_qlinearadd(dtype, a_shape, b_shape, qparams):
+        info = np.iinfo(dtype)
+        a = np.random.randint(info.min, info.max + 1, size=a_shape).astype(dtype)
+        b = np.random.randint(info.min, info.max + 1, size=b_shape).astype(dtype)
+
+        model, _ = get_model(dtype, a_shape, b_shape, qparams, True)
+        mod, _ = relay.frontend.from_onnx(model, freeze_params=True)
+        assert "qnn.add" in mod.astext()
+        shortcut = get_tvm_output_with_vm(model, [a, b], target, dev, freeze_params=True)
+
+        model, param_data = get_model(dtype, a_shape, b_shape, qparams, False)
+        fallback = get_tvm_output_with_vm(model, [a, b] + param_data, target, dev)
+        tvm.testing.assert_allclose(shortcut, fallback, rtol=0, atol=0)
+
+    for dtype, zero_points in [("uint8", (128, 100, 140)), ("int8", (0, -20, 10))]:
+        for scale in [1.0, 0.1, 0.0235]:
+            verify_qlinearadd(dtype, (4, 8), (4, 8), (scale,) + zero_points)
+            verify_qlinearadd(dtype, (4, 8), (8,), (scale,) + zero_points)
+
+
 @tvm.testing.parametrize_targets
 def test_random_uniform(target, dev):
     def get_random_uniform(shape, dtype="float32", high=1.0, low=0.0, seed=None):
@@ -5622,6 +6251,103 @@ def test_random_uniform(target, dev):
     tvm.testing.assert_allclose(real, expected, rtol=1e-5)
 
 
+@tvm.testing.parametrize_targets
+def test_random_normal(target, dev):
+    def get_random_normal(shape, dtype="float32", mean=0.0, scale=1.0, seed=None):
+        ONNX_DTYPE = mapping.NP_TYPE_TO_TENSOR_TYPE[np.dtype(dtype)]
+        node = helper.make_node(
+            "RandomNormal", [], ["out"], shape=shape, dtype=ONNX_DTYPE, mean=mean, scale=scale
+        )
+        if seed is not None:
+            seed_attr = helper.make_attribute("seed", seed)
+            node.attribute.append(seed_attr)
+
+        graph = helper.make_graph(
+            [node],
+            "random_normal_test",
+            inputs=[],
+            outputs=[helper.make_tensor_value_info("out", ONNX_DTYPE, shape)],
+        )
+        model = helper.make_model(graph, producer_name="random_normal_test")
+        return get_tvm_output_with_vm(model, [], target=target, dev=dev)
+
+    # Check that function runs and produces proper shape and dtype.
+    vals = get_random_normal([10], dtype="float32")
+    assert list(vals.shape) == [10]
+    assert vals.dtype == "float32"
+
+    vals = get_random_normal([10], dtype="float64")
+    assert list(vals.shape) == [10]
+    assert vals.dtype == "float64"
+
+    # Test N-D tensor generation.
+    vals = get_random_normal([1, 3, 100, 100], dtype="float32")
+    assert list(vals.shape) == [1, 3, 100, 100]
+
+    # Check the distribution statistics.
+    vals = get_random_normal(shape=[100, 100], mean=5.0, scale=2.0, seed=3)
+    assert np.isfinite(vals).all()
+    assert abs(np.mean(vals) - 5.0) < 1e-1
+    assert abs(np.std(vals) - 2.0) < 1e-1
+
+    # Check that a fixed seed produces the same values when run twice.
+    vals_1 = get_random_normal(shape=[10], seed=1)
+    vals_2 = get_random_normal(shape=[10], seed=1)
+    assert all(vals_1 == vals_2)
+
+
+@tvm.testing.parametrize_targets
+def test_random_normal_like(target, dev):
+    def get_random_normal_like(shape, dtype=None, mean=0.0, scale=1.0, seed=None):
+        in_dtype = "float32"
+        out_dtype = dtype if dtype is not None else in_dtype
+        attrs = {"mean": mean, "scale": scale}
+        if dtype is not None:
+            attrs["dtype"] = mapping.NP_TYPE_TO_TENSOR_TYPE[np.dtype(dtype)]
+        node = helper.make_node("RandomNormalLike", ["in"], ["out"], **attrs)
+        if seed is not None:
+            seed_attr = helper.make_attribute("seed", seed)
+            node.attribute.append(seed_attr)
+
+        graph = helper.make_graph(
+            [node],
+            "random_normal_like_test",
+            inputs=[
+                helper.make_tensor_value_info(
+                    "in", mapping.NP_TYPE_TO_TENSOR_TYPE[np.dtype(in_dtype)], shape
+                )
+            ],
+            outputs=[
+                helper.make_tensor_value_info(
+                    "out", mapping.NP_TYPE_TO_TENSOR_TYPE[np.dtype(out_dtype)], shape
+                )
+            ],
+        )
+        model = helper.make_model(graph, producer_name="random_normal_like_test")
+        indata = np.zeros(shape, dtype=in_dtype)
+        return get_tvm_output_with_vm(model, [indata], target=target, dev=dev)
+
+    # The shape and, by default, the dtype follow the input.
+    vals = get_random_normal_like([10])
+    assert list(vals.shape) == [10]
+    assert vals.dtype == "float32"
+
+    vals = get_random_normal_like([1, 3, 100, 100], dtype="float64")
+    assert list(vals.shape) == [1, 3, 100, 100]
+    assert vals.dtype == "float64"
+
+    # Check the distribution statistics.
+    vals = get_random_normal_like([100, 100], mean=-3.0, scale=0.5, seed=4)
+    assert np.isfinite(vals).all()
+    assert abs(np.mean(vals) + 3.0) < 1e-1
+    assert abs(np.std(vals) - 0.5) < 1e-1
+
+    # Check that a fixed seed produces the same values when run twice.
+    vals_1 = get_random_normal_like([10], seed=1)
+    vals_2 = get_random_normal_like([10], seed=1)
+    assert all(vals_1 == vals_2)
+
+
 @tvm.testing.parametrize_targets
 def test_convinteger(target, dev):
     def verify_convinteger(
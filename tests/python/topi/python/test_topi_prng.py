@@ -60,6 +60,24 @@ def uniform(target, dev, gen, low, high, size, dtype):
     return out_gen.numpy(), rands.asnumpy()
 
 
+def normal(target, dev, gen, mean, scale, size, dtype):
+    gen_placeholder = tvm.te.placeholder(gen.shape, name="gen", dtype="uint64")
+    mean_placeholder = tvm.te.placeholder(mean.shape, name="mean", dtype=dtype)
+    scale_placeholder = tvm.te.placeholder(scale.shape, name="scale", dtype=dtype)
+    left_placeholder, right_placeholder = tvm.topi.random.normal(
+        gen_placeholder, mean_placeholder, scale_placeholder, size, dtype
+    )
+    s = tvm.topi.generic.schedule_extern([left_placeholder, right_placeholder])
+    f = tvm.build(
+        s,
+        [gen_placeholder, mean_placeholder, scale_placeholder, left_placeholder, right_placeholder],
+    )
+    out_gen = tvm.nd.array(np.zeros(gen.shape, dtype="uint64"))
+    rands = tvm.nd.array(np.zeros(size, dtype=dtype))
+    f(tvm.nd.array(gen), tvm.nd.array(mean), tvm.nd.array(scale), out_gen, rands)
+    return out_gen.numpy(), rands.asnumpy()
+
+
 @tvm.testing.parametrize_targets
 def test_threefry_split(target, dev):
     # test that results of split do not equal eachother or the input
@@ -157,8 +175,25 @@ def test_uniform(target, dev):
         assert np.max(rands) <= 10.0
 
 
+@tvm.testing.parametrize_targets
+def test_normal(target, dev):
+    gen = tvm.relay.random.threefry_key(0).data.numpy()
+    m = 1024
+    n = 1024
+    dtypes = ["float32", "float64"]
+    for dtype in dtypes:
+        mean = np.array(5.0, dtype=dtype)
+        scale = np.array(2.0, dtype=dtype)
+        new_gen, rands = normal(target, dev, gen, mean, scale, (m, n), dtype)
+        assert (gen != new_gen).any()
+        assert np.isfinite(rands).all()
+        assert abs(np.mean(rands) - 5.0) < 1e-1
+        assert abs(np.std(rands) - 2.0) < 1e-1
+
+
 if __name__ == "__main__":
     test_threefry_split(tvm.target.Target("llvm"), tvm.device("cpu"))
     test_threefry_generate(tvm.target.Target("llvm"), tvm.device("cpu"))
     test_threefry_wrapping(tvm.target.Target("llvm"), tvm.device("cpu"))
     test_uniform(tvm.target.Target("llvm"), tvm.device("cpu"))
+    test_normal(tvm.target.Target("llvm"), tvm.device("cpu"))